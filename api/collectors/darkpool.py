@@ -17,12 +17,12 @@ import csv
 import io
 import json
 import logging
-import statistics
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import requests
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -161,38 +161,37 @@ def compute_anomalies(
                 values["total_volume"],
             ))
     
-    all_latest = []
-    anomalies = []
-    cutoff_7d = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-    
+    # Stats window per ticker: last Z_SCORE_WINDOW values before the current one
+    windows: Dict[str, List[float]] = {}
     for ticker, records in ticker_history.items():
         if len(records) < MIN_HISTORY_DAYS:
             continue
-        
         # Records are sorted by date (oldest first)
-        dpis = [r[1] for r in records]
-        
-        # Use last Z_SCORE_WINDOW values for stats, last value for current
-        if len(dpis) >= Z_SCORE_WINDOW + 1:
-            window_dpis = dpis[-(Z_SCORE_WINDOW + 1):-1]
-            current_dpi = dpis[-1]
-        else:
-            window_dpis = dpis[:-1]
-            current_dpi = dpis[-1]
-        
+        window_dpis = [r[1] for r in records[-(Z_SCORE_WINDOW + 1):-1]]
         if len(window_dpis) < MIN_HISTORY_DAYS:
             continue
-        
-        mean_dpi = statistics.mean(window_dpis)
-        std_dpi = statistics.stdev(window_dpis) if len(window_dpis) > 1 else 0.001
-        if std_dpi < 0.001:
-            std_dpi = 0.001
-        
-        z_score = (current_dpi - mean_dpi) / std_dpi
-        
-        latest_date = records[-1][0]
-        short_vol = records[-1][2]
-        total_vol = records[-1][3]
+        windows[ticker] = window_dpis
+
+    # Mean / sample std / Z for all tickers at once, one matrix per window length
+    by_length: Dict[int, List[str]] = {}
+    for ticker, window_dpis in windows.items():
+        by_length.setdefault(len(window_dpis), []).append(ticker)
+
+    z_scores: Dict[str, float] = {}
+    for tickers in by_length.values():
+        window = np.array([windows[t] for t in tickers], dtype=np.float64)
+        current = np.array([ticker_history[t][-1][1] for t in tickers], dtype=np.float64)
+        std = np.maximum(window.std(axis=1, ddof=1), 0.001)
+        z = (current - window.mean(axis=1)) / std
+        z_scores.update(zip(tickers, z.tolist()))
+
+    all_latest = []
+    anomalies = []
+    cutoff_7d = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+
+    for ticker in windows:
+        latest_date, current_dpi, short_vol, total_vol = ticker_history[ticker][-1]
+        z_score = z_scores[ticker]
         
         entry = {
             "ticker": ticker,
@@ -24,6 +24,7 @@ from api.modules.cache_manager import CacheManager
 from api.modules.cross_signal_engine import CrossSignalEngine
 from api.modules.cross_signal_engine_v2 import SmartMoneyEngineV2
 from api.modules.cross_signal_engine_v3 import generate_ranking_v3
+from api.ticker_lookup import TickerNameLookup
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,8 @@ def refresh_signals(
     4. Return status report
     """
     cache = CacheManager(cache_dir)
+    # Company names are attached once here rather than by every reader per request
+    ticker_names = TickerNameLookup(cache)
     start_time = datetime.now()
     
     # Load source data
@@ -86,9 +89,11 @@ def refresh_signals(
     
     # Write ranking.json (v1 — kept for backward compat)
     output = engine.to_json(results)
+    ticker_names.enrich_list(output["signals"])
     cache.write("ranking.json", output)
     
     # v2: Conviction-based scoring
+    v2_signals = None
     try:
         engine_v2 = SmartMoneyEngineV2()
         
@@ -110,7 +115,7 @@ def refresh_signals(
             min_score=0,
         )
         v2_output = {
-            "signals": engine_v2.to_json(v2_results),
+            "signals": ticker_names.enrich_list(engine_v2.to_json(v2_results)),
             "metadata": {
                 "engine": "v2",
                 "total": len(v2_results),
@@ -118,6 +123,7 @@ def refresh_signals(
             }
         }
         cache.write("ranking_v2.json", v2_output)
+        v2_signals = v2_output["signals"]
         logger.info(f"v2 engine: {len(v2_results)} signals written")
     except Exception as e:
         logger.warning(f"v2 engine failed (v1 still saved): {e}")
@@ -126,7 +132,9 @@ def refresh_signals(
     # This is the source of truth — also overwrites ranking.json for backward compat
     v3_output = None
     try:
-        v3_output = generate_ranking_v3(DATA_DIR)
+        # Rank the v2 signals just built; falls back to ranking_v2.json if v2 failed
+        v3_output = generate_ranking_v3(DATA_DIR, v2_signals=v2_signals)
+        ticker_names.enrich_list(v3_output["signals"])
         cache.write("ranking_v3.json", v3_output)
         # Overwrite ranking.json with V7 data for backward compatibility
         cache.write("ranking.json", v3_output)
@@ -156,8 +164,8 @@ def refresh_signals(
     result = {
         "status": "success",
         "signals_generated": len(results),
-        "high_confidence": sum(1 for r in results if r.score >= 8),
-        "avg_score": round(sum(r.score for r in results) / len(results), 2) if results else 0,
+        "high_confidence": output["metadata"]["high_confidence"],
+        "avg_score": output["metadata"]["avg_score"],
         "source_status": source_status,
         "duration_seconds": round(duration, 3),
         "timestamp": datetime.now().isoformat(),
@@ -16,18 +16,30 @@ Exposes 10 tools for AI agents to query smart money data:
 Transport: Streamable HTTP mounted at /mcp inside the FastAPI app.
 """
 
+import asyncio
+import functools
 import json
 import logging
-import os
-from datetime import datetime, timedelta, timezone
+import time
+from bisect import bisect_left
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import Optional
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.server import StreamableHTTPASGIApp
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import TextContent
+
+from api.utils import trade_side
 
 logger = logging.getLogger(__name__)
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 # ── MCP Server Instance ────────────────────────────────────────────────────
 mcp = FastMCP(
     "Meridian Smart Money Intelligence",
@@ -42,6 +54,50 @@ mcp = FastMCP(
 )
 
 
+# ── Tool Registration ──────────────────────────────────────────────────────
+
+# (tool name, arguments) → task computing that call's serialized result
+_inflight: dict = {}
+
+
+def _tool(fn):
+    """
+    Register `fn` as an MCP tool and return it unchanged for direct callers.
+
+    The registered wrapper runs the tool in a worker thread (DuckDB and file
+    reads are blocking) and serializes the result once with orjson (compact,
+    no indent) instead of FastMCP's default indented pydantic encoding.
+    Concurrent calls with identical arguments share one in-flight computation.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    async def serialized(**kwargs):
+        key = (name, json.dumps(kwargs, sort_keys=True, default=str))
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                anyio.to_thread.run_sync(lambda: _dumps(fn(**kwargs)))
+            )
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+        # shield: one caller disconnecting must not cancel the shared call
+        return TextContent(type="text", text=await asyncio.shield(task))
+
+    mcp.tool()(serialized)
+    return fn
+
+
+def _dumps(result) -> str:
+    """Encode a tool result as JSON text (orjson when available, stdlib otherwise)."""
+    try:
+        import orjson
+        return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except (ImportError, TypeError):
+        # TypeError also covers orjson.JSONEncodeError (e.g. ints beyond 64 bits)
+        return json.dumps(result, default=str, ensure_ascii=False)
+
+
 # ── Shared Data Access ─────────────────────────────────────────────────────
 
 def _get_cache():
@@ -70,6 +126,8 @@ def _get_duckdb():
 
 def _enrich_tickers(items: list, ticker_field: str = "ticker", name_field: str = "company"):
     """Enrich items with company names, silently skip on error."""
+    if not items:
+        return
     try:
         tn = _get_ticker_names()
         tn.enrich_list(items, ticker_field=ticker_field, name_field=name_field)
@@ -77,9 +135,231 @@ def _enrich_tickers(items: list, ticker_field: str = "ticker", name_field: str =
         pass
 
 
+@lru_cache(maxsize=256)
+def _cutoff_for_day(days: int, utc_day: int) -> str:
+    """ISO date string `days` before the given UTC day number (days since epoch)."""
+    return date.fromordinal(_EPOCH_ORDINAL + utc_day - days).isoformat()
+
+
 def _cutoff_date(days: int) -> str:
     """Return ISO date string N days ago."""
-    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+    return _cutoff_for_day(days, int(time.time()) // 86400)
+
+
+# ── Row Indexes ────────────────────────────────────────────────────────────
+# cache.read_cached() returns the same parsed object until the file changes,
+# so anything derived from one of its row lists is built once per file version.
+# Each entry keeps the list it was built from; a rewritten file yields a new
+# list and the entry is rebuilt on the next call.
+
+_derived_cache: dict = {}
+
+
+def _derived(name: str, rows: list, build):
+    """Return build(rows), memoized for as long as `rows` is the same list object."""
+    hit = _derived_cache.get(name)
+    if hit is not None and hit[0] is rows:
+        return hit[1]
+    value = build(rows)
+    _derived_cache[name] = (rows, value)
+    return value
+
+
+def _enriched(name: str, rows: list) -> list:
+    """
+    Cached rows with company names filled in, built once per file version.
+
+    The cached rows are shared by every read_cached() caller and must not be
+    modified, so rows missing a name are replaced by named copies in a new
+    list. Nothing is memoized when the lookup raised or had not finished
+    loading yet; the next call tries again.
+    """
+    key = f"{name}:enriched"
+    hit = _derived_cache.get(key)
+    if hit is not None and hit[0] is rows:
+        return hit[1]
+
+    try:
+        tn = _get_ticker_names()
+        ready = bool(tn._initialized)
+        missing = {r.get("ticker") for r in rows if r.get("ticker") and not r.get("company")}
+        names = {}
+        if missing:
+            stubs = [{"ticker": t} for t in missing]
+            tn.enrich_list(stubs)
+            names = {s["ticker"]: s["company"] for s in stubs if s.get("company")}
+        enriched = [
+            dict(r, company=names[r.get("ticker")])
+            if not r.get("company") and r.get("ticker") in names else r
+            for r in rows
+        ] if names else rows
+    except Exception:
+        return rows
+
+    if ready:
+        _derived_cache[key] = (rows, enriched)
+    return enriched
+
+
+def _ticker_index(name: str, rows: list, field: str = "ticker") -> dict:
+    """Map upper-cased ticker → row positions (in file order)."""
+    def build(rows):
+        index = {}
+        for i, row in enumerate(rows):
+            index.setdefault((row.get(field) or "").upper(), []).append(i)
+        return index
+    return _derived(f"{name}:{field}", rows, build)
+
+
+def _rows_for_ticker(name: str, rows: list, ticker: str) -> list:
+    """Rows whose ticker matches (case-insensitive), via the ticker index."""
+    return [rows[i] for i in _ticker_index(name, rows).get(ticker.upper(), ())]
+
+
+def _newer_than(name: str, rows: list, date_of, cutoff: str) -> list:
+    """
+    Leading rows dated >= cutoff when the list is stored newest-first.
+
+    Uses a binary search over the row dates. Lists that aren't in date order
+    (or have non-string dates) are returned unchanged for the caller to filter.
+    """
+    def build(rows):
+        try:
+            dates = [date_of(r) for r in rows]
+            if all(a >= b for a, b in zip(dates, dates[1:])):
+                dates.reverse()
+                return dates
+        except TypeError:
+            pass
+        return None
+
+    dates_asc = _derived(f"{name}:dates", rows, build)
+    if dates_asc is None:
+        return rows
+    return rows[:len(dates_asc) - bisect_left(dates_asc, cutoff)]
+
+
+def _sorted_desc(name: str, rows: list, field: str) -> tuple:
+    """Rows sorted by `field` descending (missing = 0), plus the keys ascending for bisect."""
+    def build(rows):
+        ordered = sorted(rows, key=lambda r: r.get(field) or 0, reverse=True)
+        keys_asc = [r.get(field) or 0 for r in reversed(ordered)]
+        return ordered, keys_asc
+    return _derived(f"{name}:by_{field}", rows, build)
+
+
+def _at_least(name: str, rows: list, field: str, threshold: float) -> list:
+    """Rows with `field` >= threshold, highest first (binary search on the presorted list)."""
+    ordered, keys_asc = _sorted_desc(name, rows, field)
+    return ordered[:len(keys_asc) - bisect_left(keys_asc, threshold)]
+
+
+# Ranking files in order of preference (V3 → V2 → V1)
+_RANKING_FILES = ("ranking_v3.json", "ranking_v2.json", "ranking.json")
+_ranking_source: Optional[str] = None
+
+
+def _read_ranking(cache) -> dict:
+    """
+    Newest ranking file that has signals, or {}.
+
+    The winning file is remembered: while no higher-priority file exists it
+    is read directly (one cached read) instead of walking the whole chain.
+    """
+    global _ranking_source
+    if _ranking_source is not None:
+        higher = _RANKING_FILES[:_RANKING_FILES.index(_ranking_source)]
+        if not any(cache.exists(f) for f in higher):
+            data = cache.read_cached(_ranking_source)
+            if data and "signals" in data:
+                return data
+
+    _ranking_source = None
+    for filename in _RANKING_FILES:
+        data = cache.read_cached(filename)
+        if data and "signals" in data:
+            _ranking_source = filename
+            return data
+    return {}
+
+
+# Raw trade/transaction types take only a handful of distinct values
+_trade_side = lru_cache(maxsize=128)(trade_side)
+
+_BUY_TYPES = frozenset(("buy", "purchase"))
+_SELL_TYPES = frozenset(("sell", "sale"))
+_ADD_TYPES = frozenset(("buy", "add"))
+_REDUCE_TYPES = frozenset(("sell", "reduce"))
+
+
+def _bs_counts(rows: list, field: str = "trade_type", buy=_BUY_TYPES, sell=_SELL_TYPES) -> tuple:
+    """Count (buy, sell) rows in a single pass; `field` is matched case-insensitively."""
+    buys = sells = 0
+    for row in rows:
+        value = (row.get(field) or "").lower()
+        if value in buy:
+            buys += 1
+        elif value in sell:
+            sells += 1
+    return buys, sells
+
+
+def _rank_holdings(filings: list) -> list:
+    """(value, filing, holding) for every ticker-bearing 13F holding, largest value first."""
+    ranked = [
+        (h.get("value", 0), filing, h)
+        for filing in filings
+        for h in filing.get("holdings", [])
+        if h.get("ticker", "").strip()
+    ]
+    ranked.sort(key=itemgetter(0), reverse=True)
+    return ranked
+
+
+# ── Row Filters ────────────────────────────────────────────────────────────
+# Each active filter becomes one predicate with its argument pre-normalised,
+# and _first_matching() applies them all in a single pass that stops at `limit`.
+
+def _field_is(field: str, value: str):
+    """Predicate: row[field] equals value, case-insensitively."""
+    value = value.lower()
+    return lambda row: (row.get(field) or "").lower() == value
+
+
+def _side_is(field: str, trade_type: str):
+    """Predicate: row[field] is on the same buy/sell side as trade_type."""
+    side = _trade_side(trade_type)
+    if side:
+        return lambda row: _trade_side(row.get(field)) == side
+    return _field_is(field, trade_type)
+
+
+def _on_or_after(date_of, cutoff: str):
+    """Predicate: date_of(row) >= cutoff (ISO date strings)."""
+    return lambda row: date_of(row) >= cutoff
+
+
+def _first_matching(rows: list, predicates: list, limit: Optional[int]) -> list:
+    """Up to `limit` rows (all if None) passing every predicate, in their original order."""
+    if not predicates:
+        return rows[:limit]
+    if len(predicates) == 1:
+        match = predicates[0]
+    else:
+        def match(row):
+            for predicate in predicates:
+                if not predicate(row):
+                    return False
+            return True
+    return list(islice(filter(match, rows), limit))
+
+
+def _signal_sources(signals: list) -> dict:
+    """id(signal) → frozenset of its detail sources plus its "sources" list."""
+    return {
+        id(s): frozenset([d.get("source") for d in s.get("details", [])] + list(s.get("sources", [])))
+        for s in signals
+    }
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -87,7 +367,7 @@ def _cutoff_date(days: int) -> str:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-@mcp.tool()
+@_tool
 def get_congress_trades(
     party: Optional[str] = None,
     chamber: Optional[str] = None,
@@ -126,9 +406,14 @@ def get_congress_trades(
                 sql += " AND LOWER(chamber) = LOWER(?)"
                 params.append(chamber)
             if trade_type:
-                norm = trade_type.lower().replace("sale", "sell")
-                sql += " AND LOWER(REPLACE(trade_type, 'Sale', 'Sell')) = ?"
-                params.append(norm)
+                side = _trade_side(trade_type)
+                if side:
+                    sql += " AND trade_side = ?"
+                    params.append(side)
+                else:
+                    norm = trade_type.lower().replace("sale", "sell")
+                    sql += " AND LOWER(REPLACE(trade_type, 'Sale', 'Sell')) = ?"
+                    params.append(norm)
             if days:
                 sql += " AND transaction_date >= ?"
                 params.append(_cutoff_date(days))
@@ -137,8 +422,7 @@ def get_congress_trades(
             trades = db.query(sql, params)
             _enrich_tickers(trades)
 
-            buy_count = sum(1 for t in trades if (t.get("trade_type") or "").lower() in ("buy", "purchase"))
-            sell_count = sum(1 for t in trades if (t.get("trade_type") or "").lower() in ("sell", "sale"))
+            buy_count, sell_count = _bs_counts(trades)
 
             return {
                 "trades": trades,
@@ -154,27 +438,29 @@ def get_congress_trades(
             logger.debug(f"[mcp] DuckDB congress query failed: {e}")
 
     # JSON fallback
-    data = cache.read("congress.json")
+    data = cache.read_cached("congress.json")
     if not data or "trades" not in data:
         return {"trades": [], "metadata": {"filtered": 0, "buy_count": 0, "sell_count": 0}}
 
-    trades = data["trades"]
+    trades = _enriched("congress.trades", data["trades"])
+    if days:
+        trades = _newer_than("congress.trades", trades, lambda t: t.get("transaction_date", "9999"), _cutoff_date(days))
+    predicates = []
     if party:
-        trades = [t for t in trades if t.get("party", "").lower() == party.lower()]
+        predicates.append(_field_is("party", party))
     if chamber:
-        trades = [t for t in trades if t.get("chamber", "").lower() == chamber.lower()]
+        predicates.append(_field_is("chamber", chamber))
     if trade_type:
-        norm = trade_type.lower().replace("sale", "sell")
-        trades = [t for t in trades if t.get("trade_type", "").lower().replace("sale", "sell") == norm]
+        if _trade_side(trade_type):
+            predicates.append(_side_is("trade_type", trade_type))
+        else:
+            norm = trade_type.lower().replace("sale", "sell")
+            predicates.append(lambda t: (t.get("trade_type") or "").lower().replace("sale", "sell") == norm)
     if days:
-        cutoff = _cutoff_date(days)
-        trades = [t for t in trades if t.get("transaction_date", "9999") >= cutoff]
-
-    trades = trades[:limit]
-    _enrich_tickers(trades)
+        predicates.append(_on_or_after(lambda t: t.get("transaction_date", "9999"), _cutoff_date(days)))
 
-    buy_count = sum(1 for t in trades if (t.get("trade_type") or "").lower() in ("buy", "purchase"))
-    sell_count = sum(1 for t in trades if (t.get("trade_type") or "").lower() in ("sell", "sale"))
+    trades = _first_matching(trades, predicates, limit)
+    buy_count, sell_count = _bs_counts(trades)
 
     return {
         "trades": trades,
@@ -188,7 +474,7 @@ def get_congress_trades(
     }
 
 
-@mcp.tool()
+@_tool
 def get_ark_trades(
     trade_type: Optional[str] = None,
     etf: Optional[str] = None,
@@ -219,8 +505,13 @@ def get_ark_trades(
             params = []
 
             if trade_type:
-                sql += " AND LOWER(trade_type) = LOWER(?)"
-                params.append(trade_type)
+                side = _trade_side(trade_type)
+                if side:
+                    sql += " AND trade_side = ?"
+                    params.append(side)
+                else:
+                    sql += " AND LOWER(trade_type) = LOWER(?)"
+                    params.append(trade_type)
             if etf:
                 sql += " AND UPPER(etf) = UPPER(?)"
                 params.append(etf)
@@ -231,8 +522,7 @@ def get_ark_trades(
             sql += f" ORDER BY date DESC LIMIT {int(limit)}"
             trades = db.query(sql, params)
 
-            buy_count = sum(1 for t in trades if (t.get("trade_type") or "").lower() in ("buy", "purchase"))
-            sell_count = sum(1 for t in trades if (t.get("trade_type") or "").lower() in ("sell", "sale"))
+            buy_count, sell_count = _bs_counts(trades)
 
             return {
                 "trades": trades,
@@ -248,22 +538,23 @@ def get_ark_trades(
             logger.debug(f"[mcp] DuckDB ark_trades query failed: {e}")
 
     # JSON fallback
-    data = cache.read("ark_trades.json")
+    data = cache.read_cached("ark_trades.json")
     if not data or "trades" not in data:
         return {"trades": [], "metadata": {"filtered": 0, "buy_count": 0, "sell_count": 0}}
 
     trades = data["trades"]
+    if days:
+        trades = _newer_than("ark_trades.trades", trades, lambda t: t.get("date", "9999"), _cutoff_date(days))
+    predicates = []
     if trade_type:
-        trades = [t for t in trades if t.get("trade_type", "").lower() == trade_type.lower()]
+        predicates.append(_side_is("trade_type", trade_type))
     if etf:
-        trades = [t for t in trades if t.get("etf", "").upper() == etf.upper()]
+        predicates.append(_field_is("etf", etf))
     if days:
-        cutoff = _cutoff_date(days)
-        trades = [t for t in trades if t.get("date", "9999") >= cutoff]
+        predicates.append(_on_or_after(lambda t: t.get("date", "9999"), _cutoff_date(days)))
 
-    trades = trades[:limit]
-    buy_count = sum(1 for t in trades if (t.get("trade_type") or "").lower() in ("buy", "purchase"))
-    sell_count = sum(1 for t in trades if (t.get("trade_type") or "").lower() in ("sell", "sale"))
+    trades = _first_matching(trades, predicates, limit)
+    buy_count, sell_count = _bs_counts(trades)
 
     return {
         "trades": trades,
@@ -277,7 +568,7 @@ def get_ark_trades(
     }
 
 
-@mcp.tool()
+@_tool
 def get_ark_holdings(
     etf: Optional[str] = None,
     min_weight: float = 0.0,
@@ -297,7 +588,7 @@ def get_ark_holdings(
         Dict with "holdings" list and "metadata" summary.
     """
     cache = _get_cache()
-    data = cache.read("ark_holdings.json")
+    data = cache.read_cached("ark_holdings.json")
     if not data or "holdings" not in data:
         return {"holdings": [], "metadata": {"filtered": 0}}
 
@@ -320,7 +611,7 @@ def get_ark_holdings(
     }
 
 
-@mcp.tool()
+@_tool
 def get_insider_trades(
     transaction_type: Optional[str] = None,
     ticker: Optional[str] = None,
@@ -353,8 +644,13 @@ def get_insider_trades(
             params = []
 
             if transaction_type:
-                sql += " AND LOWER(transaction_type) = LOWER(?)"
-                params.append(transaction_type)
+                side = _trade_side(transaction_type)
+                if side:
+                    sql += " AND trade_side = ?"
+                    params.append(side)
+                else:
+                    sql += " AND LOWER(transaction_type) = LOWER(?)"
+                    params.append(transaction_type)
             if ticker:
                 sql += " AND UPPER(ticker) = ?"
                 params.append(ticker.upper())
@@ -365,18 +661,18 @@ def get_insider_trades(
                 params.append(_cutoff_date(days))
 
             sql += f" ORDER BY COALESCE(trade_date, filing_date) DESC LIMIT {int(limit)}"
-            trades = db.query(sql, params)
 
             cluster_sql = "SELECT * FROM insider_clusters"
             cluster_params = []
             if ticker:
                 cluster_sql += " WHERE UPPER(ticker) = ?"
                 cluster_params.append(ticker.upper())
-            clusters = db.query(cluster_sql, cluster_params if cluster_params else None)
+
+            # One read connection for both queries
+            trades, clusters = db.query_many([(sql, params), (cluster_sql, cluster_params)])
 
             _enrich_tickers(trades)
-            buy_count = sum(1 for t in trades if t.get("transaction_type") == "Buy")
-            sell_count = sum(1 for t in trades if t.get("transaction_type") == "Sale")
+            buy_count, sell_count = _bs_counts(trades, "transaction_type")
 
             return {
                 "trades": trades,
@@ -399,30 +695,38 @@ def get_insider_trades(
             logger.debug(f"[mcp] DuckDB insider query failed: {e}")
 
     # JSON fallback
-    data = cache.read("insiders.json")
+    data = cache.read_cached("insiders.json")
     if not data or "trades" not in data:
         return {"trades": [], "clusters": [], "metadata": {"filtered": 0, "buy_count": 0, "sell_count": 0, "cluster_count": 0}}
 
-    trades = data["trades"]
+    trades = _enriched("insiders.trades", data["trades"])
     clusters = data.get("clusters", [])
 
-    if transaction_type:
-        trades = [t for t in trades if t.get("transaction_type", "").lower() == transaction_type.lower()]
     if ticker:
-        tu = ticker.upper()
-        trades = [t for t in trades if t.get("ticker", "").upper() == tu]
-        clusters = [c for c in clusters if c.get("ticker", "").upper() == tu]
+        trades = _rows_for_ticker("insiders.trades", trades, ticker)
+        clusters = _rows_for_ticker("insiders.clusters", clusters, ticker)
+    elif days:
+        trades = _newer_than(
+            "insiders.trades", trades,
+            lambda t: t.get("trade_date") or t.get("filing_date", "9999"),
+            _cutoff_date(days),
+        )
+    predicates = []
+    if transaction_type:
+        predicates.append(_side_is("transaction_type", transaction_type))
     if cluster_only:
-        cluster_tickers = {c.get("ticker", "").upper() for c in data.get("clusters", [])}
-        trades = [t for t in trades if t.get("ticker", "").upper() in cluster_tickers]
+        cluster_tickers = _derived(
+            "insiders.cluster_tickers", data.get("clusters", []),
+            lambda rows: {c.get("ticker", "").upper() for c in rows},
+        )
+        predicates.append(lambda t: (t.get("ticker") or "").upper() in cluster_tickers)
     if days:
-        cutoff = _cutoff_date(days)
-        trades = [t for t in trades if (t.get("trade_date") or t.get("filing_date", "9999")) >= cutoff]
+        predicates.append(_on_or_after(
+            lambda t: t.get("trade_date") or t.get("filing_date", "9999"), _cutoff_date(days),
+        ))
 
-    trades = trades[:limit]
-    _enrich_tickers(trades)
-    buy_count = sum(1 for t in trades if t.get("transaction_type") == "Buy")
-    sell_count = sum(1 for t in trades if t.get("transaction_type") == "Sale")
+    trades = _first_matching(trades, predicates, limit)
+    buy_count, sell_count = _bs_counts(trades, "transaction_type")
 
     return {
         "trades": trades,
@@ -443,7 +747,7 @@ def get_insider_trades(
     }
 
 
-@mcp.tool()
+@_tool
 def get_13f_filings(
     fund: Optional[str] = None,
     limit: int = 50,
@@ -501,7 +805,7 @@ def get_13f_filings(
             logger.debug(f"[mcp] DuckDB 13f query failed: {e}")
 
     # JSON fallback
-    data = cache.read("institutions.json")
+    data = cache.read_cached("institutions.json")
     if not data or "filings" not in data:
         return {"filings": [], "top_holdings": [], "metadata": {"filings_count": 0, "holdings_returned": 0}}
 
@@ -509,33 +813,28 @@ def get_13f_filings(
     if fund:
         filings = [f for f in filings if fund.lower() in f.get("fund_name", "").lower()]
 
-    # Flatten holdings
-    flattened = []
-    for filing in filings:
-        fund_name = filing.get("fund_name", "Unknown")
-        filing_date = filing.get("filing_date", "")
-        quarter = filing.get("quarter", "")
+    # Flatten holdings — ranked once per file version, then walked in value
+    # order until `limit` holdings from the selected funds are collected
+    ranked = _derived("institutions.filings", data["filings"], _rank_holdings)
+    selected = {id(f) for f in filings}
+    top_holdings = []
+    for val, filing, h in ranked:
+        if len(top_holdings) >= limit:
+            break
+        if id(filing) not in selected:
+            continue
         fund_total = filing.get("total_value", 1) or 1
-
-        for h in filing.get("holdings", []):
-            tk = h.get("ticker", "").strip()
-            if not tk:
-                continue
-            val = h.get("value", 0)
-            flattened.append({
-                "ticker": tk,
-                "issuer": h.get("issuer", ""),
-                "institution": fund_name,
-                "cik": filing.get("cik", ""),
-                "shares": h.get("shares", 0),
-                "value": val,
-                "pct_portfolio": (val / fund_total * 100) if fund_total else 0,
-                "filing_date": filing_date,
-                "quarter": quarter,
-            })
-
-    flattened.sort(key=lambda x: x.get("value", 0), reverse=True)
-    top_holdings = flattened[:limit]
+        top_holdings.append({
+            "ticker": h.get("ticker", "").strip(),
+            "issuer": h.get("issuer", ""),
+            "institution": filing.get("fund_name", "Unknown"),
+            "cik": filing.get("cik", ""),
+            "shares": h.get("shares", 0),
+            "value": val,
+            "pct_portfolio": (val / fund_total * 100) if fund_total else 0,
+            "filing_date": filing.get("filing_date", ""),
+            "quarter": filing.get("quarter", ""),
+        })
 
     filings_summary = [
         {
@@ -561,7 +860,7 @@ def get_13f_filings(
     }
 
 
-@mcp.tool()
+@_tool
 def get_darkpool_activity(
     min_zscore: float = 2.0,
     min_dpi: float = 0.4,
@@ -610,19 +909,19 @@ def get_darkpool_activity(
             logger.debug(f"[mcp] DuckDB darkpool query failed: {e}")
 
     # JSON fallback
-    data = cache.read("darkpool.json")
+    data = cache.read_cached("darkpool.json")
     if not data or "tickers" not in data:
         return {"anomalies": [], "metadata": {"filtered": 0}}
 
-    tickers = data["tickers"]
-    filtered = [t for t in tickers if t.get("z_score", 0) >= min_zscore]
+    # Highest z-score first, matching the DuckDB path
+    tickers = _enriched("darkpool.tickers", data["tickers"])
+    filtered = _at_least("darkpool.tickers", tickers, "z_score", min_zscore)
     filtered = [t for t in filtered if t.get("dpi", 0) >= min_dpi]
     if days:
         cutoff = _cutoff_date(days)
         filtered = [t for t in filtered if t.get("date", "9999") >= cutoff]
 
     filtered = filtered[:limit]
-    _enrich_tickers(filtered)
 
     return {
         "anomalies": filtered,
@@ -634,7 +933,7 @@ def get_darkpool_activity(
     }
 
 
-@mcp.tool()
+@_tool
 def get_short_interest(
     ticker: Optional[str] = None,
     min_short_ratio: Optional[float] = None,
@@ -693,30 +992,20 @@ def get_short_interest(
             logger.debug(f"[mcp] DuckDB short_interest query failed: {e}")
 
     # JSON fallback
-    from api.shared import DATA_DIR
-    raw = {}
-    try:
-        import json as _json
-        path = os.path.join(str(DATA_DIR), "short_interest.json")
-        with open(path, "r") as f:
-            raw = _json.load(f)
-    except Exception:
-        pass
-    if not raw:
-        raw = cache.read("short_interest.json")
-
-    tickers_list = raw.get("tickers", [])
+    raw = cache.read_cached("short_interest.json")
+    tickers_list = _enriched("short_interest.tickers", raw.get("tickers", []))
 
     if ticker:
-        tickers_list = [r for r in tickers_list if r.get("ticker", "").upper() == ticker.upper()]
+        tickers_list = _rows_for_ticker("short_interest.tickers", tickers_list, ticker)
+        tickers_list = sorted(tickers_list, key=lambda r: r.get(sort_col) or 0, reverse=True)
+    elif min_short_ratio is not None and sort_col == "short_pct_float":
+        tickers_list = _at_least("short_interest.tickers", tickers_list, sort_col, min_short_ratio)
+    else:
+        tickers_list, _ = _sorted_desc("short_interest.tickers", tickers_list, sort_col)
     if min_short_ratio is not None:
         tickers_list = [r for r in tickers_list if (r.get("short_pct_float") or 0) >= min_short_ratio]
 
-    reverse_key = sort_col_map.get(sort_by, "short_interest")
-    tickers_list = sorted(tickers_list, key=lambda r: r.get(reverse_key) or 0, reverse=True)
-
     filtered = tickers_list[:limit]
-    _enrich_tickers(filtered)
 
     return {
         "tickers": filtered,
@@ -729,7 +1018,7 @@ def get_short_interest(
     }
 
 
-@mcp.tool()
+@_tool
 def get_superinvestor_activity(
     manager: Optional[str] = None,
     ticker: Optional[str] = None,
@@ -752,26 +1041,23 @@ def get_superinvestor_activity(
         Dict with "activity" list and "metadata" summary.
     """
     cache = _get_cache()
-    data = cache.read("superinvestors.json")
+    data = cache.read_cached("superinvestors.json")
     if not data or "activity" not in data:
         return {"activity": [], "metadata": {"filtered": 0, "buy_count": 0, "sell_count": 0}}
 
-    activity = data["activity"]
+    activity = _enriched("superinvestors.activity", data["activity"])
 
+    if ticker:
+        activity = _rows_for_ticker("superinvestors.activity", activity, ticker)
     if activity_type:
         activity = [a for a in activity if a.get("activity_type", "").lower() == activity_type.lower()]
-    if ticker:
-        tu = ticker.upper()
-        activity = [a for a in activity if a.get("ticker", "").upper() == tu]
     if manager:
         ml = manager.lower()
         activity = [a for a in activity if ml in (a.get("manager") or "").lower()]
 
     activity = activity[:limit]
-    _enrich_tickers(activity)
 
-    buy_count = sum(1 for a in activity if a.get("activity_type") in ("Buy", "Add"))
-    sell_count = sum(1 for a in activity if a.get("activity_type") in ("Sell", "Reduce"))
+    buy_count, sell_count = _bs_counts(activity, "activity_type", _ADD_TYPES, _REDUCE_TYPES)
 
     return {
         "activity": activity,
@@ -787,7 +1073,7 @@ def get_superinvestor_activity(
     }
 
 
-@mcp.tool()
+@_tool
 def get_confluence_signals(
     min_score: float = 6.0,
     sources: Optional[str] = None,
@@ -817,35 +1103,28 @@ def get_confluence_signals(
     """
     cache = _get_cache()
 
-    # Try V3 → V2 → V1
-    data = cache.read("ranking_v3.json")
-    if not data or "signals" not in data:
-        data = cache.read("ranking_v2.json")
-    if not data or "signals" not in data:
-        data = cache.read("ranking.json")
-    if not data or "signals" not in data:
+    data = _read_ranking(cache)
+    if not data:
         return {"signals": [], "metadata": {"total": 0, "filtered": 0}}
 
-    signals = data["signals"]
+    signals = _enriched("ranking.signals", data["signals"])
 
-    # Filter by min_score
-    filtered = [s for s in signals if s.get("score", 0) >= min_score]
+    # Filter by min_score (binary search over the score-sorted signals)
+    filtered = _at_least("ranking.signals", signals, "score", min_score)
 
-    # Filter by sources
+    predicates = []
+
+    # Filter by sources (detail sources and the "sources" list, pre-collected per signal)
     if sources:
-        source_list = [s.strip().lower() for s in sources.split(",")]
-        filtered = [
-            s for s in filtered
-            if any(src in [d.get("source") for d in s.get("details", [])] for src in source_list)
-            or any(src in s.get("sources", []) for src in source_list)
-        ]
+        wanted = frozenset(s.strip().lower() for s in sources.split(","))
+        source_sets = _derived("ranking.source_sets", signals, _signal_sources)
+        predicates.append(lambda s: not wanted.isdisjoint(source_sets[id(s)]))
 
     # Filter by days
     if days:
-        cutoff = _cutoff_date(days)
-        filtered = [s for s in filtered if s.get("signal_date", "9999") >= cutoff]
+        predicates.append(_on_or_after(lambda s: s.get("signal_date", "9999"), _cutoff_date(days)))
 
-    _enrich_tickers(filtered)
+    filtered = _first_matching(filtered, predicates, None)
     total_filtered = len(filtered)
     filtered = filtered[:limit]
 
@@ -862,7 +1141,7 @@ def get_confluence_signals(
     }
 
 
-@mcp.tool()
+@_tool
 def get_market_regime() -> dict:
     """Get current market regime assessment: Green (risk-on), Yellow (caution), or Red (defensive).
 
@@ -7,21 +7,172 @@ All data flows through these cache files:
 
 Features:
 - Atomic writes (write to tmp, then rename)
+- orjson (de)serialization when installed, stdlib json otherwise
 - File existence and freshness checks
 - Thread-safe operations
+- Bounded LRU of parsed files for read-only callers (read_cached)
 - Automatic directory creation
 """
 
 import json
+import math
+import mmap
 import os
-import tempfile
+import sys
+import threading
 import time
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
+# Top-level lists longer than this are encoded this many records at a time,
+# so a large cache file is never held in memory as one encoded buffer.
+STREAM_CHUNK_RECORDS = 1000
+
+# Files at least this large are parsed straight from a read-only mmap
+# instead of first being copied into a bytes object.
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _loads(raw) -> Any:
+    """
+    Parse JSON bytes with orjson when installed.
+
+    Falls back to stdlib json, which also accepts the NaN/Infinity literals
+    that older json.dump-written caches may contain.
+    """
+    try:
+        import orjson
+        return orjson.loads(raw)
+    except (ImportError, ValueError):
+        return json.loads(raw if isinstance(raw, bytes) else bytes(raw))
+
+
+# Low-cardinality string fields shared by many rows across cache files.
+# read_cached() interns their values so long-lived parsed files hold one
+# string object per distinct value instead of one per row.
+INTERN_FIELDS = frozenset({
+    "ticker", "source", "etf", "sector", "party", "chamber",
+    "change_type", "trade_type", "transaction_type", "direction",
+})
+
+
+def _intern_fields(data: Any) -> None:
+    """Intern string values of INTERN_FIELDS keys anywhere in `data`, in place."""
+    intern = sys.intern
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if type(value) is str:
+                    if key in INTERN_FIELDS:
+                        node[key] = intern(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+
+
+def _write_json(f, data: Any) -> None:
+    """
+    Write `data` as JSON to the binary file `f`.
+
+    A dict holding large record lists (trades, filings, tickers...) is
+    written key by key with those lists encoded in chunks of
+    STREAM_CHUNK_RECORDS; the output is the same JSON document.
+    """
+    if not (
+        isinstance(data, dict)
+        and all(isinstance(k, str) for k in data)
+        and any(isinstance(v, list) and len(v) > STREAM_CHUNK_RECORDS for v in data.values())
+    ):
+        f.write(_dumps(data))
+        return
+
+    f.write(b"{")
+    for i, (key, value) in enumerate(data.items()):
+        if i:
+            f.write(b",")
+        f.write(_dumps(key))
+        f.write(b":")
+        if isinstance(value, list) and len(value) > STREAM_CHUNK_RECORDS:
+            f.write(b"[")
+            for start in range(0, len(value), STREAM_CHUNK_RECORDS):
+                if start:
+                    f.write(b",")
+                f.write(_dumps(value[start:start + STREAM_CHUNK_RECORDS])[1:-1])
+            f.write(b"]")
+        else:
+            f.write(_dumps(value))
+    f.write(b"}")
+
+
+def _load_file(f) -> Any:
+    """Parse an open binary file, via mmap when it is large."""
+    if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+        return _loads(f.read())
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return _loads(view)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """True if a NaN/Infinity float appears anywhere in `data`."""
+    isfinite = math.isfinite
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            if not isfinite(node):
+                return True
+            continue
+        if isinstance(node, dict):
+            node = node.values()
+        elif not isinstance(node, (list, tuple)):
+            continue
+        for value in node:
+            if isinstance(value, float):
+                if not isfinite(value):
+                    return True
+            elif isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+    return False
+
+
+def _dumps(data: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON with orjson when installed.
+
+    Non-JSON values are written as str(value), as json.dump(default=str)
+    did: datetimes are passed through to `default` to keep that format.
+    NumPy scalars/arrays are written as numbers. Anything orjson rejects
+    (e.g. ints beyond 64 bits) goes through stdlib json instead, as do
+    payloads holding NaN/Infinity floats: orjson would write those as null,
+    while readers compare them as numbers, so they keep json.dump's literals.
+    """
+    try:
+        import orjson
+        out = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    except (ImportError, TypeError):
+        # TypeError also covers orjson.JSONEncodeError
+        return _stdlib_dumps(data)
+    # Any NaN/Infinity would show up as null; only then is the payload walked
+    if b"null" in out and _has_non_finite(data):
+        return _stdlib_dumps(data)
+    return out
+
+
+def _stdlib_dumps(data: Any) -> bytes:
+    return json.dumps(data, default=str, ensure_ascii=False).encode("utf-8")
+
 
 class CacheManager:
     """
@@ -33,9 +184,50 @@ class CacheManager:
         data = cache.read("congress.json")
     """
 
-    def __init__(self, cache_dir: str = "data"):
+    def __init__(self, cache_dir: str = "data", max_parsed: int = 32):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # LRU of filename → ((st_ino, st_mtime_ns, st_size), parsed data) for read_cached()
+        self._parsed: "OrderedDict[str, tuple]" = OrderedDict()
+        self._parsed_lock = threading.Lock()
+        self._max_parsed = max_parsed
+        self._sweep_stale_tmp()
+
+    def _tmp_path(self, filename: str) -> str:
+        """
+        Temp path for an in-progress write of `filename`.
+
+        Unique per process and thread, so concurrent writers never share
+        one, and fixed for a given writer, so no random name is generated
+        per write and leftovers can be traced to their process.
+        """
+        return str(self.cache_dir / f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    def _sweep_stale_tmp(self) -> None:
+        """Remove temp files left behind by writers whose process has exited."""
+        try:
+            candidates = list(self.cache_dir.glob(".*.tmp"))
+        except OSError:
+            return
+        for path in candidates:
+            parts = path.name[:-len(".tmp")].rsplit(".", 2)
+            if len(parts) != 3 or not parts[1].isdigit() or not parts[2].isdigit():
+                continue
+            pid = int(parts[1])
+            if pid == os.getpid():
+                continue
+            try:
+                os.kill(pid, 0)
+                continue  # still running
+            except ProcessLookupError:
+                pass
+            except OSError:
+                continue  # exists but not ours to signal
+            try:
+                path.unlink()
+                logger.info(f"Removed stale cache temp file: {path.name}")
+            except OSError:
+                pass
 
     def _filepath(self, filename: str) -> Path:
         """Resolve filename to full path within cache directory."""
@@ -54,8 +246,8 @@ class CacheManager:
         """
         filepath = self._filepath(filename)
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                data = _load_file(f)
             if not isinstance(data, dict):
                 logger.warning(f"Cache file {filename} is not a JSON object, got {type(data).__name__}")
                 return {}
@@ -63,13 +255,58 @@ class CacheManager:
         except FileNotFoundError:
             logger.debug(f"Cache file not found: {filename}")
             return {}
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # json.JSONDecodeError / UnicodeDecodeError
             logger.error(f"Invalid JSON in {filename}: {e}")
             return {}
         except OSError as e:
             logger.error(f"OS error reading {filename}: {e}")
             return {}
 
+    def read_cached(self, filename: str) -> Mapping[str, Any]:
+        """
+        Read a JSON cache file, reusing the parsed object while the file is unchanged.
+
+        The file is only re-parsed when its inode, mtime or size changes
+        (atomic writes always produce a new inode); unreadable or non-object
+        files are remembered as {} the same way. The most recently used
+        `max_parsed` files are kept. The returned mapping is shared between
+        callers and is read-only at the top level; nested values must not be
+        modified either — use read() when the data is going to be modified.
+        """
+        filepath = self._filepath(filename)
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
+            self.invalidate(filename)
+            return {}
+        except OSError as e:
+            logger.error(f"OS error reading {filename}: {e}")
+            return {}
+
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._parsed_lock:
+            hit = self._parsed.get(filename)
+            if hit is not None and hit[0] == key:
+                self._parsed.move_to_end(filename)
+                return hit[1]
+
+        # Parse outside the lock so one large file doesn't block other reads
+        data = self.read(filename)
+        _intern_fields(data)
+        data = MappingProxyType(data)
+        with self._parsed_lock:
+            self._parsed[filename] = (key, data)
+            self._parsed.move_to_end(filename)
+            while len(self._parsed) > self._max_parsed:
+                self._parsed.popitem(last=False)
+        return data
+
+    def invalidate(self, filename: str) -> None:
+        """Drop the read_cached() entry for a file."""
+        with self._parsed_lock:
+            self._parsed.pop(filename, None)
+
     def write(self, filename: str, data: Dict[str, Any]) -> bool:
         """
         Write data to a JSON cache file atomically.
@@ -80,16 +317,14 @@ class CacheManager:
         filepath = self._filepath(filename)
         try:
             # Write to temp file in same directory (same filesystem for atomic rename)
-            fd, tmp_path = tempfile.mkstemp(
-                dir=str(self.cache_dir),
-                prefix=f".{filename}.",
-                suffix=".tmp"
-            )
+            tmp_path = self._tmp_path(filename)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+                with os.fdopen(fd, "wb") as f:
+                    _write_json(f, data)
                 # Atomic rename
                 os.replace(tmp_path, str(filepath))
+                self.invalidate(filename)
                 logger.debug(f"Wrote cache file: {filename} ({filepath.stat().st_size} bytes)")
                 return True
             except Exception:
@@ -156,6 +391,7 @@ class CacheManager:
         filepath = self._filepath(filename)
         try:
             filepath.unlink()
+            self.invalidate(filename)
             logger.info(f"Deleted cache file: {filename}")
             return True
         except FileNotFoundError:
@@ -25,17 +25,25 @@ Verification: PRD example → score = 8.46
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import sys
+from datetime import date, datetime, timedelta
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+from api.utils import date_ordinal
+
 logger = logging.getLogger(__name__)
 
 
 # ── Signal Definition ──────────────────────────────────────────────────
 
+# Every v1 criterion is a buy / new / increased position, so all signals
+# and results share this one direction string.
+BULLISH = "Bullish"
+
 
-@dataclass
+@dataclass(slots=True)
 class RawSignal:
     """A single extracted signal from any source."""
     ticker: str
@@ -45,9 +53,14 @@ class RawSignal:
     weight: float         # Source weight (1.0, 0.8, 0.6)
     description: str      # Human-readable description
     raw_data: dict = field(default_factory=dict)  # Full original record
+    # date parsed once at construction, for clustering/scoring (-1 if unparseable)
+    _date_ord: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._date_ord = date_ordinal(self.date)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfluenceResult:
     """A scored confluence signal for one ticker."""
     ticker: str
@@ -78,7 +91,8 @@ class SignalExtractor:
     Extract qualifying signals from each data source.
     
     Each method reads the cached data and returns RawSignal objects
-    that meet the PRD-defined criteria.
+    that meet the PRD-defined criteria. Cheap field thresholds are checked
+    before the date, so only candidate rows pay for date parsing.
     """
 
     def __init__(self, reference_date: Optional[str] = None):
@@ -91,14 +105,14 @@ class SignalExtractor:
             self.today = datetime.strptime(reference_date, "%Y-%m-%d")
         else:
             self.today = datetime.now()
+        self._today_ord = self.today.toordinal()
 
     def _days_ago(self, date_str: str) -> int:
         """Calculate days between date_str and today."""
-        try:
-            dt = datetime.strptime(date_str[:10], "%Y-%m-%d")
-            return (self.today - dt).days
-        except (ValueError, TypeError):
+        date_ord = date_ordinal(date_str)
+        if date_ord < 0:
             return 9999
+        return self._today_ord - date_ord
 
     def extract_congress(self, data: dict) -> List[RawSignal]:
         """
@@ -110,6 +124,7 @@ class SignalExtractor:
         - Filed within last 45 days
         """
         signals = []
+        days_ago = self._days_ago
         for trade in data.get("trades", []):
             # Must be a buy
             if trade.get("trade_type") != "Buy":
@@ -122,7 +137,7 @@ class SignalExtractor:
             
             # Recency: use filing_date if available, else transaction_date
             date = trade.get("filing_date") or trade.get("transaction_date", "")
-            if self._days_ago(date) > 45:
+            if days_ago(date) > 45:
                 continue
 
             excess = trade.get("excess_return_pct")
@@ -133,7 +148,7 @@ class SignalExtractor:
             signals.append(RawSignal(
                 ticker=trade["ticker"],
                 source="congress",
-                direction="Bullish",
+                direction=BULLISH,
                 date=trade.get("transaction_date", date),
                 weight=1.0,
                 description=f"{rep} ({party}) bought {amount_range}",
@@ -159,19 +174,20 @@ class SignalExtractor:
         - Trade within last 30 days
         """
         signals = []
+        days_ago = self._days_ago
         for trade in data.get("trades", []):
             if trade.get("trade_type") != "Buy":
                 continue
             
-            date = trade.get("date", "")
-            if self._days_ago(date) > 30:
-                continue
-
             # Weight threshold (skip if weight not available)
             weight = trade.get("weight_pct")
             if weight is not None and weight < 1.0:
                 continue
 
+            date = trade.get("date", "")
+            if days_ago(date) > 30:
+                continue
+
             etf = trade.get("etf", "")
             shares = trade.get("shares", 0)
             change_type = trade.get("change_type", "")
@@ -183,7 +199,7 @@ class SignalExtractor:
             signals.append(RawSignal(
                 ticker=trade["ticker"],
                 source="ark",
-                direction="Bullish",
+                direction=BULLISH,
                 date=date,
                 weight=1.0,
                 description=f"{desc} ({shares:,} shares)",
@@ -209,11 +225,8 @@ class SignalExtractor:
         - Anomaly within last 7 days
         """
         signals = []
+        days_ago = self._days_ago
         for entry in data.get("tickers", data.get("anomalies", [])):
-            date = entry.get("date", "")
-            if self._days_ago(date) > 7:
-                continue
-            
             z_score = entry.get("z_score", 0)
             if z_score < 2.0:
                 continue
@@ -229,10 +242,14 @@ class SignalExtractor:
             if volume < 500_000:
                 continue
 
+            date = entry.get("date", "")
+            if days_ago(date) > 7:
+                continue
+
             signals.append(RawSignal(
                 ticker=entry.get("ticker", ""),
                 source="darkpool",
-                direction="Bullish",
+                direction=BULLISH,
                 date=date,
                 weight=0.8,
                 description=f"DPI {dpi:.2f} (Z-score {z_score:.1f}σ)",
@@ -257,6 +274,7 @@ class SignalExtractor:
         - Cluster buys (3+ insiders) get higher weight (1.2 vs 0.9)
         """
         signals = []
+        days_ago = self._days_ago
         cluster_tickers = set(data.get("metadata", {}).get("cluster_tickers", []))
         # Also build from clusters list
         for c in data.get("clusters", []):
@@ -271,7 +289,7 @@ class SignalExtractor:
                 continue
 
             date = trade.get("filing_date") or trade.get("trade_date", "")
-            if self._days_ago(date) > 30:
+            if days_ago(date) > 30:
                 continue
 
             ticker = (trade.get("ticker") or "").upper().strip()
@@ -295,7 +313,7 @@ class SignalExtractor:
             signals.append(RawSignal(
                 ticker=ticker,
                 source="insider",
-                direction="Bullish",
+                direction=BULLISH,
                 date=trade.get("trade_date", date),
                 weight=weight,
                 description=desc,
@@ -322,9 +340,10 @@ class SignalExtractor:
         - Filing within last 90 days
         """
         signals = []
+        days_ago = self._days_ago
         for filing in data.get("filings", []):
             filing_date = filing.get("filing_date", "")
-            if self._days_ago(filing_date) > 90:
+            if days_ago(filing_date) > 90:
                 continue
             
             fund_name = filing.get("fund_name", "")
@@ -357,7 +376,7 @@ class SignalExtractor:
                 signals.append(RawSignal(
                     ticker=ticker if ticker else issuer[:10],
                     source="institution",
-                    direction="Bullish",
+                    direction=BULLISH,
                     date=filing_date,
                     weight=0.6,
                     description=f"{fund_name} {desc_action} (${value/1e6:.0f}M)",
@@ -377,6 +396,31 @@ class SignalExtractor:
 # ── Confluence Engine ──────────────────────────────────────────────────
 
 
+# One bit per source, in alphabetical order so a mask's set bits list the
+# sources already sorted. A cluster's unique sources are a 5-bit mask.
+SOURCES = ("ark", "congress", "darkpool", "insider", "institution")
+SOURCE_INDEX = {name: i for i, name in enumerate(SOURCES)}
+_ARK, _CONGRESS, _DARKPOOL, _INSIDER, _INSTITUTION = range(len(SOURCES))
+# Sorted source names for every mask
+SOURCES_FROM_MASK = tuple(
+    tuple(name for i, name in enumerate(SOURCES) if mask >> i & 1)
+    for mask in range(1 << len(SOURCES))
+)
+
+# Sources whose signals are all kept by deduplication; the others keep
+# only their strongest signal.
+KEEP_ALL_SOURCES = frozenset({"congress", "ark", "insider"})
+
+
+# Field that ranks signals of each single-best source during deduplication
+STRENGTH_FIELDS = {"darkpool": "z_score", "institution": "value"}
+
+
+def _signal_strength(s: RawSignal) -> float:
+    """Dedup rank for darkpool (Z-score) and institution (position value) signals."""
+    return s.raw_data.get(STRENGTH_FIELDS[s.source]) or 0
+
+
 class CrossSignalEngine:
     """
     Core confluence detection and scoring engine.
@@ -407,6 +451,27 @@ class CrossSignalEngine:
             return datetime.strptime(self._reference_date, "%Y-%m-%d")
         return datetime.now()
 
+    def _extract_each(
+        self,
+        congress_data: Optional[dict] = None,
+        ark_data: Optional[dict] = None,
+        darkpool_data: Optional[dict] = None,
+        institution_data: Optional[dict] = None,
+        insider_data: Optional[dict] = None,
+    ) -> Iterator[List[RawSignal]]:
+        """Yield the qualifying signals of each available source in turn."""
+        for label, extract, data in (
+            ("Congress", self.extractor.extract_congress, congress_data),
+            ("ARK", self.extractor.extract_ark, ark_data),
+            ("Dark Pool", self.extractor.extract_darkpool, darkpool_data),
+            ("Institutions", self.extractor.extract_institutions, institution_data),
+            ("Insiders", self.extractor.extract_insiders, insider_data),
+        ):
+            if data:
+                signals = extract(data)
+                logger.info(f"{label}: {len(signals)} qualifying signals")
+                yield signals
+
     def extract_all_signals(
         self,
         congress_data: Optional[dict] = None,
@@ -417,45 +482,35 @@ class CrossSignalEngine:
     ) -> List[RawSignal]:
         """Extract qualifying signals from all available sources."""
         all_signals = []
-        
-        if congress_data:
-            signals = self.extractor.extract_congress(congress_data)
-            logger.info(f"Congress: {len(signals)} qualifying signals")
-            all_signals.extend(signals)
-        
-        if ark_data:
-            signals = self.extractor.extract_ark(ark_data)
-            logger.info(f"ARK: {len(signals)} qualifying signals")
-            all_signals.extend(signals)
-        
-        if darkpool_data:
-            signals = self.extractor.extract_darkpool(darkpool_data)
-            logger.info(f"Dark Pool: {len(signals)} qualifying signals")
-            all_signals.extend(signals)
-        
-        if institution_data:
-            signals = self.extractor.extract_institutions(institution_data)
-            logger.info(f"Institutions: {len(signals)} qualifying signals")
-            all_signals.extend(signals)
-        
-        if insider_data:
-            signals = self.extractor.extract_insiders(insider_data)
-            logger.info(f"Insiders: {len(signals)} qualifying signals")
+        for signals in self._extract_each(
+            congress_data, ark_data, darkpool_data, institution_data, insider_data
+        ):
             all_signals.extend(signals)
         
         logger.info(f"Total: {len(all_signals)} signals from all sources")
         return all_signals
 
-    def group_by_ticker(self, signals: List[RawSignal]) -> Dict[str, List[RawSignal]]:
-        """Group signals by ticker symbol."""
-        groups: Dict[str, List[RawSignal]] = {}
+    def group_by_ticker(
+        self,
+        signals: List[RawSignal],
+        groups: Optional[Dict[str, List[RawSignal]]] = None,
+    ) -> Dict[str, List[RawSignal]]:
+        """
+        Group signals by ticker symbol.
+
+        Pass `groups` to add to existing buckets instead of starting new ones.
+        """
+        if groups is None:
+            groups = {}
         for s in signals:
             ticker = s.ticker.upper().strip()
             if not ticker:
                 continue
-            if ticker not in groups:
-                groups[ticker] = []
-            groups[ticker].append(s)
+            bucket = groups.get(ticker)
+            if bucket is None:
+                groups[sys.intern(ticker)] = [s]
+            else:
+                bucket.append(s)
         return groups
 
     def find_best_cluster(
@@ -466,37 +521,63 @@ class CrossSignalEngine:
         
         Strategy: Use each signal's date as an anchor, find which other
         signals fall within ±window_days. Return the cluster with the
-        highest total weight.
+        highest total weight (earliest anchor in input order on ties),
+        members in input order.
+
+        Signals are swept in date order: each anchor's cluster is a
+        contiguous run of the sorted list, so two pointers and prefix
+        weight sums find every cluster in O(N log N) overall.
         """
         if len(signals) <= 1:
             return signals
 
-        best_cluster = signals[:1]
-        best_weight = signals[0].weight
+        window = self.window_days
+        # Common case: every signal is dated and within window_days of every
+        # other, so each anchor's cluster is the whole list
+        ords = [s._date_ord for s in signals]
+        lowest = min(ords)
+        if lowest >= 0 and max(ords) - lowest <= window:
+            if round(sum(s.weight for s in signals), 9) > signals[0].weight:
+                return list(signals)
+            return signals[:1]
+
+        # Stable sort: among equal dates the first index is the earliest in input order
+        order = sorted(
+            (i for i, s in enumerate(signals) if s._date_ord >= 0),
+            key=lambda i: signals[i]._date_ord,
+        )
+        ords = [signals[i]._date_ord for i in order]
+        prefix = [0.0]
+        for i in order:
+            prefix.append(prefix[-1] + signals[i].weight)
 
-        for anchor in signals:
-            try:
-                anchor_dt = datetime.strptime(anchor.date[:10], "%Y-%m-%d")
-            except (ValueError, TypeError):
-                continue
-            
-            cluster = []
-            total_weight = 0
-            for s in signals:
-                try:
-                    s_dt = datetime.strptime(s.date[:10], "%Y-%m-%d")
-                except (ValueError, TypeError):
-                    continue
-                
-                if abs((s_dt - anchor_dt).days) <= self.window_days:
-                    cluster.append(s)
-                    total_weight += s.weight
-            
-            if total_weight > best_weight:
-                best_cluster = cluster
+        best_range = None
+        best_weight = signals[0].weight
+        best_anchor = -1  # the signals[:1] fallback only loses to a strictly heavier cluster
+        lo = hi = k = 0
+        n = len(order)
+        while k < n:
+            anchor_ord = ords[k]
+            anchor_idx = order[k]
+            while ords[lo] < anchor_ord - window:
+                lo += 1
+            while hi < n and ords[hi] <= anchor_ord + window:
+                hi += 1
+            # Rounded so equal clusters compare equal whatever the summation order
+            total_weight = round(prefix[hi] - prefix[lo], 9)
+            if total_weight > best_weight or (
+                total_weight == best_weight and anchor_idx < best_anchor
+            ):
+                best_range = (lo, hi)
                 best_weight = total_weight
+                best_anchor = anchor_idx
+            # Anchors sharing a date have the same cluster
+            while k < n and ords[k] == anchor_ord:
+                k += 1
 
-        return best_cluster
+        if best_range is None:
+            return signals[:1]
+        return [signals[i] for i in sorted(order[best_range[0]:best_range[1]])]
 
     def deduplicate_sources(self, signals: List[RawSignal]) -> List[RawSignal]:
         """
@@ -514,26 +595,25 @@ class CrossSignalEngine:
         
         deduped = []
         for source, source_signals in by_source.items():
-            if source == "congress":
-                # Keep all congress signals (multiple members = stronger signal)
-                # but we'll only count weight once for scoring
-                deduped.extend(source_signals)
-            elif source == "ark":
-                # Keep all ARK signals (different ETFs = independent decisions)
-                deduped.extend(source_signals)
-            elif source == "insider":
-                # Keep all insider signals (multiple insiders = cluster = stronger)
+            if source in KEEP_ALL_SOURCES:
+                # Keep all congress (multiple members = stronger signal), ARK
+                # (different ETFs = independent decisions) and insider
+                # (multiple insiders = cluster) signals; weight counts once
                 deduped.extend(source_signals)
             else:
                 # For darkpool/institution, keep the strongest signal
-                best = max(source_signals, key=lambda s: s.raw_data.get("z_score", 0) or s.raw_data.get("value", 0) or 0)
-                deduped.append(best)
+                deduped.append(max(source_signals, key=_signal_strength))
         
         return deduped
 
-    def score_cluster(self, ticker: str, signals: List[RawSignal]) -> ConfluenceResult:
+    def score_cluster(
+        self, ticker: str, signals: List[RawSignal], today: Optional[datetime] = None
+    ) -> ConfluenceResult:
         """
         Score a cluster of signals for one ticker using PRD §2.3 formula.
+
+        `today` lets a batch run resolve the reference date once for every
+        ticker; it defaults to self._today().
         
         Base_Score          = Σ(unique source weights)
         Recency_Multiplier  = 1.0 - (days_since_last / 30)
@@ -542,29 +622,108 @@ class CrossSignalEngine:
         Confluence_Score    = (Base × Recency) + Count_Bonus + Excess_Bonus
         Normalized_Score    = min(Score / max_possible × 10, 10)
         """
-        today = self._today()
-
-        # Unique sources and their weights
-        source_weights = {}
+        if today is None:
+            today = self._today()
+
+        # Unique sources and their weights, most recent date, best congress excess
+        mask = 0
+        weights = [0.0] * len(SOURCES)
+        base_score = 0.0
+        most_recent_ord = -1
+        congress_excess = 0.0
         for s in signals:
-            if s.source not in source_weights:
-                source_weights[s.source] = s.weight
-        
-        # Base Score = sum of unique source weights
-        base_score = sum(source_weights.values())
+            i = SOURCE_INDEX[s.source]
+            if not mask >> i & 1:
+                mask |= 1 << i
+                weights[i] = s.weight
+                base_score += s.weight
+            if s._date_ord > most_recent_ord:
+                most_recent_ord = s._date_ord
+            if s.source == "congress":
+                er = s.raw_data.get("excess_return_pct")
+                if er is not None and er > congress_excess:
+                    congress_excess = er
 
-        # Days since most recent signal
-        dates = []
-        for s in signals:
-            try:
-                dates.append(datetime.strptime(s.date[:10], "%Y-%m-%d"))
-            except (ValueError, TypeError):
-                pass
-        
-        if dates:
-            most_recent = max(dates)
-            days_since_last = (today - most_recent).days
-            signal_date = most_recent.strftime("%Y-%m-%d")
+        return self._build_result(
+            ticker, signals, mask, weights, base_score,
+            most_recent_ord, congress_excess, today,
+        )
+
+    def _cluster_and_score(
+        self, ticker: str, signals: List[RawSignal], today: datetime
+    ) -> Optional[ConfluenceResult]:
+        """
+        find_best_cluster → deduplicate_sources → score_cluster for one ticker,
+        with deduplication and the scoring inputs gathered in a single pass
+        over the cluster. Returns None for an empty cluster.
+        """
+        cluster = self.find_best_cluster(signals)
+        if not cluster:
+            return None
+
+        kept: Dict[str, List[RawSignal]] = {}   # source → kept signals, first-seen order
+        strength: Dict[str, float] = {}
+        most_recent_ord = -1
+        congress_excess = 0.0
+        keep_all = KEEP_ALL_SOURCES
+        for s in cluster:
+            source = s.source
+            if source in keep_all:
+                if source in kept:
+                    kept[source].append(s)
+                else:
+                    kept[source] = [s]
+                if s._date_ord > most_recent_ord:
+                    most_recent_ord = s._date_ord
+                if source == "congress":
+                    er = s.raw_data.get("excess_return_pct")
+                    if er is not None and er > congress_excess:
+                        congress_excess = er
+            else:
+                rank = _signal_strength(s)
+                if source not in kept or rank > strength[source]:
+                    kept[source] = [s]
+                    strength[source] = rank
+
+        deduped: List[RawSignal] = []
+        mask = 0
+        weights = [0.0] * len(SOURCES)
+        base_score = 0.0
+        for source, group in kept.items():
+            i = SOURCE_INDEX[source]
+            mask |= 1 << i
+            weights[i] = group[0].weight
+            base_score += group[0].weight
+            deduped.extend(group)
+            if source not in KEEP_ALL_SOURCES and group[0]._date_ord > most_recent_ord:
+                most_recent_ord = group[0]._date_ord
+
+        return self._build_result(
+            ticker, deduped, mask, weights, base_score,
+            most_recent_ord, congress_excess, today,
+        )
+
+    def _build_result(
+        self,
+        ticker: str,
+        signals: List[RawSignal],
+        source_mask: int,
+        source_weights: List[float],
+        base_score: float,
+        most_recent_ord: int,
+        congress_excess: float,
+        today: datetime,
+    ) -> ConfluenceResult:
+        """
+        Apply the PRD §2.3 formula to a deduplicated cluster's scoring inputs.
+
+        `source_mask` has bit SOURCE_INDEX[name] set per unique source,
+        `source_weights` is indexed the same way (0.0 when absent) and
+        `base_score` is the sum of those weights.
+        """
+        if most_recent_ord >= 0:
+            days_since_last = today.toordinal() - most_recent_ord
+            signal_date = date.fromordinal(most_recent_ord).isoformat()
         else:
             days_since_last = 30
             signal_date = ""
@@ -573,16 +732,10 @@ class CrossSignalEngine:
         recency_multiplier = max(0, 1.0 - (days_since_last / 30))
 
         # Signal Count Bonus (based on unique source count)
-        unique_source_count = len(source_weights)
+        unique_source_count = source_mask.bit_count()
         signal_count_bonus = 0.5 * (unique_source_count - 1)
 
         # Excess Return Bonus (from Congress data)
-        congress_excess = 0.0
-        for s in signals:
-            if s.source == "congress":
-                er = s.raw_data.get("excess_return_pct")
-                if er is not None and er > congress_excess:
-                    congress_excess = er
         excess_return_bonus = min(congress_excess / 10, 2.0)
 
         # Confluence Score
@@ -592,20 +745,18 @@ class CrossSignalEngine:
         normalized = min(raw_score / self.max_possible_score * 10, 10.0)
 
         # Per-source scores (for display)
-        congress_score = source_weights.get("congress", 0.0) * recency_multiplier
-        ark_score = source_weights.get("ark", 0.0) * recency_multiplier
-        darkpool_score = source_weights.get("darkpool", 0.0) * recency_multiplier
-        institution_score = source_weights.get("institution", 0.0) * recency_multiplier
-        insider_score = source_weights.get("insider", 0.0) * recency_multiplier
+        congress_score = source_weights[_CONGRESS] * recency_multiplier
+        ark_score = source_weights[_ARK] * recency_multiplier
+        darkpool_score = source_weights[_DARKPOOL] * recency_multiplier
+        institution_score = source_weights[_INSTITUTION] * recency_multiplier
+        insider_score = source_weights[_INSIDER] * recency_multiplier
 
-        # Direction: mostly Bullish for buy signals
-        direction = "Bullish"
-        sources = sorted(source_weights.keys())
+        sources = list(SOURCES_FROM_MASK[source_mask])
 
         return ConfluenceResult(
             ticker=ticker,
             score=round(normalized, 2),
-            direction=direction,
+            direction=BULLISH,
             sources=sources,
             source_count=unique_source_count,
             signals=signals,
@@ -644,37 +795,33 @@ class CrossSignalEngine:
         if min_score is None:
             min_score = self.min_score
 
-        # Step 1: Extract
-        all_signals = self.extract_all_signals(
-            congress_data=congress_data,
-            ark_data=ark_data,
-            darkpool_data=darkpool_data,
-            institution_data=institution_data,
-            insider_data=insider_data,
-        )
-
-        if not all_signals:
+        # Step 1 & 2: Extract each source straight into per-ticker buckets
+        groups: Dict[str, List[RawSignal]] = {}
+        total = 0
+        for signals in self._extract_each(
+            congress_data, ark_data, darkpool_data, institution_data, insider_data
+        ):
+            total += len(signals)
+            self.group_by_ticker(signals, groups)
+
+        logger.info(f"Total: {total} signals from all sources")
+        if not groups:
             return []
 
-        # Step 2: Group by ticker
-        groups = self.group_by_ticker(all_signals)
-
-        # Step 3 & 4: Cluster and score each ticker
+        # Step 3 & 4: Cluster and score each ticker (one reference date for the run)
+        today = self._today()
         results = []
         for ticker, signals in groups.items():
-            cluster = self.find_best_cluster(signals)
-            cluster = self.deduplicate_sources(cluster)
-            
             # Only score if >= 1 signal (single signals still get scored)
-            if cluster:
-                result = self.score_cluster(ticker, cluster)
+            result = self._cluster_and_score(ticker, signals, today)
+            if result is not None:
                 results.append(result)
 
         # Step 5: Filter by minimum score
         results = [r for r in results if r.score >= min_score]
 
         # Step 6: Sort by score descending
-        results.sort(key=lambda r: r.score, reverse=True)
+        results.sort(key=attrgetter("score"), reverse=True)
         
         logger.info(
             f"Generated {len(results)} confluence signals "
@@ -686,10 +833,17 @@ class CrossSignalEngine:
     def to_json(self, results: List[ConfluenceResult]) -> dict:
         """Convert results to JSON-serializable dict for cache."""
         signals_out = []
+        high_confidence = 0
+        score_total = 0.0
+        # Metadata is tallied in the same pass that builds each entry
         for r in results:
+            score = r.score
+            score_total += score
+            if score >= 8:
+                high_confidence += 1
             signals_out.append({
                 "ticker": r.ticker,
-                "score": r.score,
+                "score": score,
                 "direction": r.direction,
                 "sources": r.sources,
                 "source_count": r.source_count,
@@ -722,10 +876,8 @@ class CrossSignalEngine:
             "metadata": {
                 "schema_version": "1.0.0",
                 "total_count": len(signals_out),
-                "high_confidence": sum(1 for r in results if r.score >= 8),
-                "avg_score": round(
-                    sum(r.score for r in results) / len(results), 2
-                ) if results else 0,
+                "high_confidence": high_confidence,
+                "avg_score": round(score_total / len(results), 2) if results else 0,
                 "last_updated": datetime.now().isoformat(),
             },
         }
@@ -19,14 +19,84 @@ Output: 0-100 scale, meaningful differentiation for single-source signals.
 """
 
 import logging
+import math
+import re
+from bisect import bisect_right
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
+from api.utils import date_ordinal
+
 logger = logging.getLogger(__name__)
 
+_exp = math.exp
+
+
+# Name fragments matched as substrings of lower-cased fund names, insider
+# titles and manager names. Each set is compiled into one alternation so a
+# name is scanned once instead of once per fragment.
+PRESTIGE_FUNDS = {"berkshire", "citadel", "renaissance", "bridgewater", "two sigma", "de shaw", "millennium", "point72", "soros"}
+SENIOR_TITLES = {"ceo", "cfo", "coo", "cto", "president", "chairman", "chief"}
+JUNIOR_TITLES = {"vp", "vice president", "director", "svp"}
+PRESTIGE_MANAGERS = {
+    "warren buffett", "berkshire hathaway",
+    "bill ackman", "pershing square",
+    "carl icahn", "icahn capital",
+    "david einhorn", "greenlight capital",
+    "seth klarman", "baupost",
+    "david tepper", "appaloosa",
+    "howard marks", "oaktree",
+    "chase coleman", "tiger global",
+    "chris hohn", "tci fund",
+    "li lu", "himalaya capital",
+    "michael burry", "scion asset",
+    "daniel loeb", "third point",
+    "viking global",
+}
+
+
+def _substring_pattern(fragments) -> re.Pattern:
+    """Regex whose .search() is truthy iff any fragment occurs in the text."""
+    return re.compile("|".join(re.escape(f) for f in sorted(fragments)))
+
+
+_PRESTIGE_FUND_RE = _substring_pattern(PRESTIGE_FUNDS)
+_SENIOR_TITLE_RE = _substring_pattern(SENIOR_TITLES)
+_JUNIOR_TITLE_RE = _substring_pattern(JUNIOR_TITLES)
+_PRESTIGE_MANAGER_RE = _substring_pattern(PRESTIGE_MANAGERS)
+
+
+def _tier(value: float, tiers: tuple) -> int:
+    """
+    Score of `value` in a (bounds, scores) tier table.
+
+    `bounds` are ascending lower bounds; a value reaching k of them gets
+    scores[k], the same as a descending `if value >= bound` ladder.
+    """
+    bounds, scores = tiers
+    if value != value:  # NaN reaches no bound
+        return scores[0]
+    return scores[bisect_right(bounds, value)]
 
-@dataclass
+
+def _distinct_count(rows: List[dict], key: str) -> int:
+    """Number of distinct row.get(key, "") values; a lone row needs no set."""
+    if len(rows) == 1:
+        return 1
+    return len({r.get(key, "") for r in rows})
+
+
+# exp(-0.693 * days / half_life) for each half-life the scorers use, by whole day
+DECAY_TABLE_DAYS = 400
+_DECAY_TABLES = {
+    half_life: tuple(math.exp(-0.693 * d / half_life) for d in range(DECAY_TABLE_DAYS))
+    for half_life in (7, 14, 30)
+}
+
+
+@dataclass(slots=True)
 class SignalDetail:
     """Individual signal event."""
     source: str
@@ -38,7 +108,7 @@ class SignalDetail:
     raw_data: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartMoneySignal:
     """Scored smart money signal for one ticker."""
     ticker: str
@@ -85,23 +155,47 @@ class SmartMoneyEngineV2:
         "Over $50,000,000": 75000000,
     }
 
+    # Tier tables for _tier(): (ascending lower bounds, score below/at each bound)
+    CONGRESS_AMOUNT_TIERS = (
+        (15_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000),
+        (10, 15, 25, 35, 45, 55, 70, 85),
+    )
+    ARK_FUND_COUNT_TIERS = ((2, 3, 4, 5), (20, 40, 60, 75, 85))
+    DARKPOOL_Z_TIERS = ((3, 4, 5), (30, 50, 70, 85))
+    DARKPOOL_DPI_BONUS = ((0.4, 0.6, 0.8), (0, 5, 10, 15))
+    DARKPOOL_VOLUME_BONUS = ((1_000_000, 5_000_000, 10_000_000), (0, 5, 10, 15))
+    INSTITUTION_VALUE_TIERS = ((100_000_000, 500_000_000, 1_000_000_000), (20, 35, 55, 75))
+    INSIDER_VALUE_TIERS = (
+        (50_000, 100_000, 500_000, 1_000_000, 5_000_000),
+        (10, 15, 30, 50, 65, 80),
+    )
+    INSIDER_CLUSTER_BONUS = ((3, 4, 5), (0, 15, 20, 25))
+    SUPERINVESTOR_CONSENSUS_BONUS = ((2, 3, 5, 8, 11), (0, 5, 12, 20, 28, 35))
+    SUPERINVESTOR_IMPACT_BONUS = ((0.05, 0.1, 0.3), (0, 2, 5, 10))
+    SHORT_FLOAT_TIERS = ((10, 15, 20, 30), (15, 30, 45, 60, 75))   # short % of float >= 5
+    SHORT_SHARES_TIERS = ((50_000_000, 100_000_000), (10, 15, 25))  # no float data
+    SHORT_DTC_BONUS = ((3, 5, 7), (0, 5, 10, 15))
+    SHORT_CHANGE_BONUS = ((5, 10, 20), (0, 5, 10, 15))
+
     def __init__(self, reference_date: Optional[str] = None):
         if reference_date:
             self.today = datetime.strptime(reference_date, "%Y-%m-%d")
         else:
             self.today = datetime.now()
+        self._today_ord = self.today.toordinal()
     
     def _days_ago(self, date_str: str) -> int:
-        try:
-            dt = datetime.strptime(date_str[:10], "%Y-%m-%d")
-            return max(0, (self.today - dt).days)
-        except (ValueError, TypeError):
+        date_ord = date_ordinal(date_str)
+        if date_ord < 0:
             return 9999
+        return max(0, self._today_ord - date_ord)
 
     def _recency_decay(self, days: int, half_life: int = 14) -> float:
         """Exponential decay: 1.0 at day 0, 0.5 at half_life, ~0 at 3× half_life."""
-        import math
-        return math.exp(-0.693 * days / half_life)
+        table = _DECAY_TABLES.get(half_life)
+        if table is not None and type(days) is int and 0 <= days < DECAY_TABLE_DAYS:
+            return table[days]
+        return _exp(-0.693 * days / half_life)
     
     def _parse_amount(self, amount_range: str, amount_max: float = 0) -> float:
         """Parse congress amount range to approximate dollar value."""
@@ -122,43 +216,36 @@ class SmartMoneyEngineV2:
         if not trades:
             return []
         
-        signals_by_ticker: Dict[str, List[dict]] = {}
+        days_ago = self._days_ago
+        signals_by_ticker: Dict[str, List[dict]] = defaultdict(list)
         for t in trades:
-            trade_type = t.get("trade_type", "")
-            if "Purchase" not in trade_type and trade_type != "Buy":
+            get = t.get
+            trade_type = get("trade_type", "")
+            # Collectors normalize to "Buy"; "Purchase" variants are legacy rows
+            if trade_type != "Buy" and "Purchase" not in trade_type:
                 continue
             
-            date = t.get("filing_date") or t.get("transaction_date", "")
-            if self._days_ago(date) > 60:
+            date = get("filing_date") or get("transaction_date", "")
+            if days_ago(date) > 60:
                 continue
             
-            ticker = (t.get("ticker") or "").upper().strip()
+            ticker = (get("ticker") or "").upper().strip()
             if not ticker:
                 continue
             
-            if ticker not in signals_by_ticker:
-                signals_by_ticker[ticker] = []
             signals_by_ticker[ticker].append(t)
         
         results = []
         for ticker, ticker_trades in signals_by_ticker.items():
-            # Best trade (highest amount)
-            amounts = []
-            for t in ticker_trades:
-                amt = self._parse_amount(t.get("amount_range", ""), t.get("amount_max", 0))
-                amounts.append(amt)
-            
+            # Best trade (highest amount); each trade's amount is parsed once
+            amounts = [
+                self._parse_amount(t.get("amount_range", ""), t.get("amount_max", 0))
+                for t in ticker_trades
+            ]
             max_amount = max(amounts) if amounts else 0
             
             # Amount tier score (0-85)
-            if max_amount >= 5_000_000: amount_score = 85
-            elif max_amount >= 1_000_000: amount_score = 70
-            elif max_amount >= 500_000: amount_score = 55
-            elif max_amount >= 250_000: amount_score = 45
-            elif max_amount >= 100_000: amount_score = 35
-            elif max_amount >= 50_000: amount_score = 25
-            elif max_amount >= 15_000: amount_score = 15
-            else: amount_score = 10
+            amount_score = _tier(max_amount, self.CONGRESS_AMOUNT_TIERS)
             
             # Recency
             dates = [t.get("transaction_date") or t.get("filing_date", "") for t in ticker_trades]
@@ -173,13 +260,13 @@ class SmartMoneyEngineV2:
                     excess_bonus = max(excess_bonus, min(er * 1.5, 15))
             
             # Multi-member bonus
-            unique_members = len(set(t.get("representative", "") for t in ticker_trades))
+            unique_members = _distinct_count(ticker_trades, "representative")
             member_bonus = min((unique_members - 1) * 10, 20)
             
             conviction = min(100, (amount_score * recency) + excess_bonus + member_bonus)
             
             # Build description
-            best_trade = max(ticker_trades, key=lambda t: self._parse_amount(t.get("amount_range", ""), t.get("amount_max", 0)))
+            best_trade = ticker_trades[amounts.index(max_amount)]
             rep = best_trade.get("representative", "Unknown")
             party = best_trade.get("party", "")
             amt_range = best_trade.get("amount_range", "")
@@ -218,41 +305,39 @@ class SmartMoneyEngineV2:
         if not trades:
             return []
         
-        signals_by_ticker: Dict[str, List[dict]] = {}
+        days_ago = self._days_ago
+        signals_by_ticker: Dict[str, List[dict]] = defaultdict(list)
         for t in trades:
-            if t.get("trade_type") != "Buy":
+            get = t.get
+            if get("trade_type") != "Buy":
                 continue
-            date = t.get("date", "")
-            if self._days_ago(date) > 30:
+            date = get("date", "")
+            if days_ago(date) > 30:
                 continue
-            ticker = (t.get("ticker") or "").upper().strip()
+            ticker = (get("ticker") or "").upper().strip()
             if not ticker:
                 continue
-            if ticker not in signals_by_ticker:
-                signals_by_ticker[ticker] = []
             signals_by_ticker[ticker].append(t)
         
-        # Holdings lookup for weight info
-        holdings_map: Dict[str, list] = {}
+        # Largest holding weight per bought ticker, reduced while scanning holdings
+        max_weights: Dict[str, float] = {}
         if holdings:
             for h in holdings:
                 t = (h.get("ticker") or "").upper().strip()
-                if t not in holdings_map:
-                    holdings_map[t] = []
-                holdings_map[t].append(h)
+                if t not in signals_by_ticker:
+                    continue
+                w = h.get("weight_pct", 0)
+                if t not in max_weights or w > max_weights[t]:
+                    max_weights[t] = w
         
         results = []
         for ticker, ticker_trades in signals_by_ticker.items():
             # Unique funds buying
-            funds = set(t.get("etf", "") for t in ticker_trades)
+            funds = {t.get("etf", "") for t in ticker_trades}
             fund_count = len(funds)
             
             # Fund count score
-            if fund_count >= 5: fund_score = 85
-            elif fund_count >= 4: fund_score = 75
-            elif fund_count >= 3: fund_score = 60
-            elif fund_count >= 2: fund_score = 40
-            else: fund_score = 20
+            fund_score = _tier(fund_count, self.ARK_FUND_COUNT_TIERS)
             
             # Position type bonus
             new_position = any(t.get("change_type") == "NEW_POSITION" for t in ticker_trades)
@@ -260,9 +345,8 @@ class SmartMoneyEngineV2:
             
             # Weight bonus
             weight_bonus = 0
-            ticker_holdings = holdings_map.get(ticker, [])
-            if ticker_holdings:
-                max_weight = max(h.get("weight_pct", 0) for h in ticker_holdings)
+            max_weight = max_weights.get(ticker)
+            if max_weight is not None:
                 if max_weight > 5: weight_bonus = 10
                 elif max_weight > 2: weight_bonus = 5
             
@@ -312,56 +396,45 @@ class SmartMoneyEngineV2:
         if not data:
             return []
         
-        signals_by_ticker: Dict[str, dict] = {}
+        # ticker → (z_score, days ago, entry) of its strongest anomaly
+        days_ago = self._days_ago
+        strongest: Dict[str, tuple] = {}
         for entry in data:
-            date = entry.get("date", "")
-            if self._days_ago(date) > 14:
-                continue
-            
-            z_score = entry.get("z_score", 0)
+            get = entry.get
+            z_score = get("z_score", 0)
             if z_score < 2.0:
                 continue
+
+            days = days_ago(get("date", ""))
+            if days > 14:
+                continue
             
-            dpi = entry.get("dpi", 0)
-            if dpi > 1:
-                dpi = dpi / 100.0
-            
-            ticker = (entry.get("ticker") or "").upper().strip()
+            ticker = (get("ticker") or "").upper().strip()
             if not ticker:
                 continue
             
             # Keep strongest signal per ticker
-            if ticker not in signals_by_ticker or entry.get("z_score", 0) > signals_by_ticker[ticker].get("z_score", 0):
-                signals_by_ticker[ticker] = entry
+            best = strongest.get(ticker)
+            if best is None or z_score > best[0]:
+                strongest[ticker] = (z_score, days, entry)
         
         results = []
-        for ticker, entry in signals_by_ticker.items():
-            z_score = entry.get("z_score", 0)
+        for ticker, (z_score, days, entry) in strongest.items():
             dpi = entry.get("dpi", 0)
             if dpi > 1:
                 dpi = dpi / 100.0
             volume = entry.get("total_volume", 0)
             
             # Z-score tier
-            if z_score >= 5: z_tier = 85
-            elif z_score >= 4: z_tier = 70
-            elif z_score >= 3: z_tier = 50
-            else: z_tier = 30
+            z_tier = _tier(z_score, self.DARKPOOL_Z_TIERS)
             
             # DPI bonus
-            dpi_bonus = 0
-            if dpi >= 0.8: dpi_bonus = 15
-            elif dpi >= 0.6: dpi_bonus = 10
-            elif dpi >= 0.4: dpi_bonus = 5
+            dpi_bonus = _tier(dpi, self.DARKPOOL_DPI_BONUS)
             
             # Volume bonus
-            vol_bonus = 0
-            if volume >= 10_000_000: vol_bonus = 15
-            elif volume >= 5_000_000: vol_bonus = 10
-            elif volume >= 1_000_000: vol_bonus = 5
+            vol_bonus = _tier(volume, self.DARKPOOL_VOLUME_BONUS)
             
             # Recency (faster decay for darkpool)
-            days = self._days_ago(entry.get("date", ""))
             recency = self._recency_decay(days, half_life=7)
             
             conviction = min(100, (z_tier * recency) + dpi_bonus + vol_bonus)
@@ -398,16 +471,14 @@ class SmartMoneyEngineV2:
         if not filings:
             return []
         
-        PRESTIGE_FUNDS = {"berkshire", "citadel", "renaissance", "bridgewater", "two sigma", "de shaw", "millennium", "point72", "soros"}
-        
-        signals_by_ticker: Dict[str, List[dict]] = {}
+        signals_by_ticker: Dict[str, List[dict]] = defaultdict(list)
         for filing in filings:
             filing_date = filing.get("filing_date", "")
             if self._days_ago(filing_date) > 120:
                 continue
             
             fund_name = filing.get("fund_name", "")
-            is_prestige = any(p in fund_name.lower() for p in PRESTIGE_FUNDS)
+            is_prestige = _PRESTIGE_FUND_RE.search(fund_name.lower()) is not None
             
             for holding in filing.get("holdings", []):
                 value = holding.get("value", 0)
@@ -418,9 +489,6 @@ class SmartMoneyEngineV2:
                 if not ticker:
                     continue
                 
-                if ticker not in signals_by_ticker:
-                    signals_by_ticker[ticker] = []
-                
                 signals_by_ticker[ticker].append({
                     **holding,
                     "fund_name": fund_name,
@@ -435,10 +503,7 @@ class SmartMoneyEngineV2:
             max_value = best.get("value", 0)
             
             # Value tier
-            if max_value >= 1_000_000_000: val_tier = 75
-            elif max_value >= 500_000_000: val_tier = 55
-            elif max_value >= 100_000_000: val_tier = 35
-            else: val_tier = 20
+            val_tier = _tier(max_value, self.INSTITUTION_VALUE_TIERS)
             
             # Prestige bonus
             prestige_bonus = 15 if any(h.get("is_prestige") for h in holdings) else 0
@@ -456,7 +521,7 @@ class SmartMoneyEngineV2:
                     change_bonus = max(change_bonus, 5)
             
             # Multi-fund bonus
-            unique_funds = len(set(h.get("fund_name", "") for h in holdings))
+            unique_funds = _distinct_count(holdings, "fund_name")
             fund_bonus = min((unique_funds - 1) * 10, 20)
             
             # Recency
@@ -511,61 +576,52 @@ class SmartMoneyEngineV2:
                 if ticker:
                     cluster_map[ticker] = c
 
-        signals_by_ticker: Dict[str, List[dict]] = {}
+        days_ago = self._days_ago
+        signals_by_ticker: Dict[str, List[dict]] = defaultdict(list)
         for t in trades:
-            if t.get("transaction_type") != "Buy":
+            get = t.get
+            if get("transaction_type") != "Buy":
                 continue
 
-            date = t.get("filing_date") or t.get("trade_date", "")
-            if self._days_ago(date) > 45:
+            date = get("filing_date") or get("trade_date", "")
+            if days_ago(date) > 45:
                 continue
 
-            value = t.get("value", 0)
+            value = get("value", 0)
             if value < 10_000:  # Very small buys less meaningful
                 continue
 
-            ticker = (t.get("ticker") or "").upper().strip()
+            ticker = (get("ticker") or "").upper().strip()
             if not ticker:
                 continue
 
-            if ticker not in signals_by_ticker:
-                signals_by_ticker[ticker] = []
             signals_by_ticker[ticker].append(t)
 
         results = []
-        SENIOR_TITLES = {"ceo", "cfo", "coo", "cto", "president", "chairman", "chief"}
 
         for ticker, ticker_trades in signals_by_ticker.items():
-            # Max value
-            max_value = max(t.get("value", 0) for t in ticker_trades)
+            # Largest trade
+            best_trade = max(ticker_trades, key=lambda t: t.get("value", 0))
+            max_value = best_trade.get("value", 0)
 
             # Value tier (0-80)
-            if max_value >= 5_000_000: val_tier = 80
-            elif max_value >= 1_000_000: val_tier = 65
-            elif max_value >= 500_000: val_tier = 50
-            elif max_value >= 100_000: val_tier = 30
-            elif max_value >= 50_000: val_tier = 15
-            else: val_tier = 10
+            val_tier = _tier(max_value, self.INSIDER_VALUE_TIERS)
 
             # Cluster bonus
-            unique_insiders = set(t.get("insider_name", "") for t in ticker_trades)
-            insider_count = len(unique_insiders)
+            insider_count = _distinct_count(ticker_trades, "insider_name")
             cluster_info = cluster_map.get(ticker, {})
             # Use the larger of detected vs cluster page count
             cluster_count = max(insider_count, cluster_info.get("insider_count", 0))
 
-            cluster_bonus = 0
-            if cluster_count >= 5: cluster_bonus = 25
-            elif cluster_count >= 4: cluster_bonus = 20
-            elif cluster_count >= 3: cluster_bonus = 15
+            cluster_bonus = _tier(cluster_count, self.INSIDER_CLUSTER_BONUS)
 
             # Title seniority bonus
             title_bonus = 0
             for t in ticker_trades:
                 title = (t.get("title") or "").lower()
-                if any(s in title for s in SENIOR_TITLES):
+                if _SENIOR_TITLE_RE.search(title):
                     title_bonus = max(title_bonus, 10)
-                elif any(s in title for s in ("vp", "vice president", "director", "svp")):
+                elif _JUNIOR_TITLE_RE.search(title):
                     title_bonus = max(title_bonus, 5)
 
             # Recency
@@ -576,7 +632,6 @@ class SmartMoneyEngineV2:
             conviction = min(100, (val_tier * recency) + cluster_bonus + title_bonus)
 
             # Build description
-            best_trade = max(ticker_trades, key=lambda t: t.get("value", 0))
             name = best_trade.get("insider_name", "Unknown")
             title_str = best_trade.get("title", "")
             desc = f"{name}"
@@ -622,22 +677,6 @@ class SmartMoneyEngineV2:
         if not data:
             return []
 
-        PRESTIGE_MANAGERS = {
-            "warren buffett", "berkshire hathaway",
-            "bill ackman", "pershing square",
-            "carl icahn", "icahn capital",
-            "david einhorn", "greenlight capital",
-            "seth klarman", "baupost",
-            "david tepper", "appaloosa",
-            "howard marks", "oaktree",
-            "chase coleman", "tiger global",
-            "chris hohn", "tci fund",
-            "li lu", "himalaya capital",
-            "michael burry", "scion asset",
-            "daniel loeb", "third point",
-            "viking global",
-        }
-
         activity = data.get("activity", [])
         if not activity:
             return []
@@ -686,7 +725,7 @@ class SmartMoneyEngineV2:
             # Track per-manager data
             if source_type == "per_manager":
                 manager_name = (entry.get("manager") or "").lower()
-                is_prestige = any(p in manager_name for p in PRESTIGE_MANAGERS)
+                is_prestige = _PRESTIGE_MANAGER_RE.search(manager_name) is not None
 
                 if activity_type in ("Buy", "Add"):
                     ts["buy_managers"] += 1
@@ -706,6 +745,7 @@ class SmartMoneyEngineV2:
 
         # Score each ticker
         results = []
+        signal_date = datetime.now().strftime("%Y-%m-%d")
         for ticker, ts in ticker_signals.items():
             # Determine direction: net of buy vs sell managers
             net_buy = ts["manager_count_buy"] - ts["manager_count_sell"]
@@ -728,18 +768,7 @@ class SmartMoneyEngineV2:
                     base_score = 30
 
             # Manager count bonus (consensus strength)
-            if manager_count >= 11:
-                consensus_bonus = 35
-            elif manager_count >= 8:
-                consensus_bonus = 28
-            elif manager_count >= 5:
-                consensus_bonus = 20
-            elif manager_count >= 3:
-                consensus_bonus = 12
-            elif manager_count >= 2:
-                consensus_bonus = 5
-            else:
-                consensus_bonus = 0
+            consensus_bonus = _tier(manager_count, self.SUPERINVESTOR_CONSENSUS_BONUS)
 
             # Prestige bonus
             prestige_bonus = 0
@@ -749,15 +778,7 @@ class SmartMoneyEngineV2:
                 prestige_bonus = 15
 
             # Portfolio impact bonus
-            pct = ts["portfolio_pct"]
-            if pct >= 0.3:
-                impact_bonus = 10
-            elif pct >= 0.1:
-                impact_bonus = 5
-            elif pct >= 0.05:
-                impact_bonus = 2
-            else:
-                impact_bonus = 0
+            impact_bonus = _tier(ts["portfolio_pct"], self.SUPERINVESTOR_IMPACT_BONUS)
 
             conviction = min(100, base_score + consensus_bonus + prestige_bonus + impact_bonus)
 
@@ -776,7 +797,7 @@ class SmartMoneyEngineV2:
                 source="superinvestor",
                 ticker=ticker,
                 direction=direction,
-                date=datetime.now().strftime("%Y-%m-%d"),
+                date=signal_date,
                 description=desc,
                 conviction=round(conviction, 1),
                 raw_data={
@@ -864,42 +885,17 @@ class SmartMoneyEngineV2:
                 continue
 
             # Short % of float tier (0-75)
-            if short_pct_float >= 30:
-                si_tier = 75
-            elif short_pct_float >= 20:
-                si_tier = 60
-            elif short_pct_float >= 15:
-                si_tier = 45
-            elif short_pct_float >= 10:
-                si_tier = 30
-            elif short_pct_float >= 5:
-                si_tier = 15
+            if short_pct_float >= 5:
+                si_tier = _tier(short_pct_float, self.SHORT_FLOAT_TIERS)
             else:
                 # Fall back to absolute SI for stocks without float data
-                if short_interest >= 100_000_000:
-                    si_tier = 25
-                elif short_interest >= 50_000_000:
-                    si_tier = 15
-                else:
-                    si_tier = 10
+                si_tier = _tier(short_interest, self.SHORT_SHARES_TIERS)
 
             # Days to cover bonus
-            dtc_bonus = 0
-            if days_to_cover >= 7:
-                dtc_bonus = 15
-            elif days_to_cover >= 5:
-                dtc_bonus = 10
-            elif days_to_cover >= 3:
-                dtc_bonus = 5
+            dtc_bonus = _tier(days_to_cover, self.SHORT_DTC_BONUS)
 
             # Change direction bonus (increasing short interest = more conviction)
-            change_bonus = 0
-            if change_pct >= 20:
-                change_bonus = 15
-            elif change_pct >= 10:
-                change_bonus = 10
-            elif change_pct >= 5:
-                change_bonus = 5
+            change_bonus = _tier(change_pct, self.SHORT_CHANGE_BONUS)
 
             # Cross-reference bonuses (the real alpha!)
             squeeze_bonus = 0
@@ -1027,26 +1023,31 @@ class SmartMoneyEngineV2:
                 all_details.setdefault(s.ticker, []).append(s)
         
         # Step 2 & 3: Merge and score
+        # ── Tiered source weighting ──────────────────────────────
+        # "Active" sources (require deliberate human action) vs
+        # "Passive" sources (exist for most large-cap stocks)
+        active_sources = {'congress', 'ark', 'darkpool', 'insider', 'institution'}
+        passive_sources = {'short_interest', 'superinvestor'}
+
         results = []
         for ticker, details in all_details.items():
+            # One pass: best conviction per source, most recent date, first company name
             source_convictions = {}
+            signal_date = ""
+            company = ""
             for d in details:
-                source_convictions[d.source] = max(
-                    source_convictions.get(d.source, 0),
-                    d.conviction
-                )
+                prev = source_convictions.get(d.source, 0)
+                source_convictions[d.source] = d.conviction if d.conviction > prev else prev
+                if d.date and d.date > signal_date:
+                    signal_date = d.date
+                if not company:
+                    company = d.raw_data.get("company", "")
             
             max_conviction = max(source_convictions.values())
             source_count = len(source_convictions)
             
-            # ── Tiered source weighting ──────────────────────────────
-            # "Active" sources (require deliberate human action) vs
-            # "Passive" sources (exist for most large-cap stocks)
-            active_sources = {'congress', 'ark', 'darkpool', 'insider', 'institution'}
-            passive_sources = {'short_interest', 'superinvestor'}
-            
-            active_count = len(set(source_convictions.keys()) & active_sources)
-            passive_count = len(set(source_convictions.keys()) & passive_sources)
+            active_count = len(active_sources.intersection(source_convictions))
+            passive_count = len(passive_sources.intersection(source_convictions))
             
             # Multi-source bonus: active sources worth more
             # Active: +15 each (cap 45), Passive: +5 each (cap 10)
@@ -1067,20 +1068,10 @@ class SmartMoneyEngineV2:
             else:
                 source_cap = 1.0    # 4+ active sources: uncapped
             
-            # Most recent date
-            dates = [d.date for d in details if d.date]
-            signal_date = max(dates) if dates else ""
             recency_days = self._days_ago(signal_date) if signal_date else 30
             
             final_score = min(100, (max_conviction * source_cap) + multi_bonus)
             
-            # Get company name from any detail
-            company = ""
-            for d in details:
-                company = d.raw_data.get("company", "")
-                if company:
-                    break
-            
             results.append(SmartMoneySignal(
                 ticker=ticker,
                 company=company,
@@ -20,9 +20,12 @@ Usage:
 import json
 import logging
 import math
+import sys
+from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -46,9 +49,52 @@ ALWAYS_NEUTRAL = {"darkpool", "institution", "short_interest"}
 
 NEUTRAL_BASE_DISCOUNT = 0.6
 
+# One bit per known source, so set membership in _score_v7 is a single `&`
+SOURCE_BITS: Dict[str, int] = {src: 1 << i for i, src in enumerate(WEIGHTS)}
+ACTIVE_MASK = sum(SOURCE_BITS[src] for src in ACTIVE_SOURCES)
+ALWAYS_NEUTRAL_MASK = sum(SOURCE_BITS[src] for src in ALWAYS_NEUTRAL)
+
+# Trade-file sources whose direction is buy vs sell count:
+# (source, file in data_dir, trade type field, is_buy(type), is_sell(type)).
+# Congress types are normalized to "Buy"/"Sell"; substrings catch legacy values.
+TRADE_DIRECTION_SPECS = (
+    ("congress", "congress.json", "trade_type",
+     lambda t: t == "Buy" or "Purchase" in t, lambda t: "Sell" in t or "Sale" in t),
+    ("ark", "ark_trades.json", "trade_type",
+     lambda t: t == "Buy", lambda t: t == "Sell"),
+    ("insider", "insiders.json", "transaction_type",
+     lambda t: t == "Buy", lambda t: t in ("Sale", "Sell")),
+)
+
 
 # ── Direction Detection ───────────────────────────────────────────────
 
+def _read_json(path: Path) -> Any:
+    """
+    Parse a JSON file with orjson when installed.
+
+    Falls back to stdlib json, which also accepts NaN/Infinity literals.
+    """
+    raw = path.read_bytes()
+    try:
+        import orjson
+        return orjson.loads(raw)
+    except (ImportError, ValueError):
+        return json.loads(raw)
+
+
+def _iter_records(path: Path, key: str) -> Iterator[dict]:
+    """
+    Yield the records stored under `key` in a JSON data file.
+
+    The parsed file is referenced only by this generator, so it is released
+    once iteration finishes instead of staying alive while the next source
+    file is parsed.
+    """
+    data = _read_json(path)
+    yield from data.get(key, [])
+
+
 def _detect_directions(data_dir: Path) -> Dict[str, Dict[str, str]]:
     """
     Detect per-ticker direction for each directional source from raw trade files.
@@ -66,131 +112,82 @@ def _detect_directions(data_dir: Path) -> Dict[str, Dict[str, str]]:
         {ticker: {source: direction}}  where direction ∈ {"bullish", "bearish", "neutral"}
     """
     directions: Dict[str, Dict[str, str]] = {}
+    # Tickers repeat across thousands of trades: intern them so the count and
+    # direction dicts (and rank_v7's lookups) share one string per ticker
+    intern = sys.intern
 
     def ensure_ticker(ticker: str) -> None:
         if ticker not in directions:
             directions[ticker] = {}
 
-    def resolve_direction(counts: Dict[str, int]) -> str:
-        if counts["buy"] > counts["sell"]:
+    def resolve_direction(counts: List[int]) -> str:
+        buy, sell = counts
+        if buy > sell:
             return "bullish"
-        elif counts["sell"] > counts["buy"]:
+        elif sell > buy:
             return "bearish"
         return "neutral"
 
-    # ── Congress ────────────────────────────────────────────────────
-    congress_file = data_dir / "congress.json"
-    if congress_file.exists():
-        try:
-            with open(congress_file) as f:
-                data = json.load(f)
-            trade_counts: Dict[str, Dict[str, int]] = {}
-            for trade in data.get("trades", []):
-                ticker = (trade.get("ticker") or "").upper().strip()
-                if not ticker:
-                    continue
-                trade_type = trade.get("trade_type", "")
-                if ticker not in trade_counts:
-                    trade_counts[ticker] = {"buy": 0, "sell": 0}
-                if "Purchase" in trade_type or trade_type == "Buy":
-                    trade_counts[ticker]["buy"] += 1
-                elif "Sell" in trade_type or "Sale" in trade_type:
-                    trade_counts[ticker]["sell"] += 1
-            for ticker, counts in trade_counts.items():
-                ensure_ticker(ticker)
-                directions[ticker]["congress"] = resolve_direction(counts)
-        except Exception as e:
-            logger.warning(f"Direction detection failed for congress: {e}")
-
-    # ── ARK ─────────────────────────────────────────────────────────
-    ark_file = data_dir / "ark_trades.json"
-    if ark_file.exists():
-        try:
-            with open(ark_file) as f:
-                data = json.load(f)
-            trade_counts = {}
-            for trade in data.get("trades", []):
-                ticker = (trade.get("ticker") or "").upper().strip()
-                if not ticker:
-                    continue
-                trade_type = trade.get("trade_type", "")
-                if ticker not in trade_counts:
-                    trade_counts[ticker] = {"buy": 0, "sell": 0}
-                if trade_type == "Buy":
-                    trade_counts[ticker]["buy"] += 1
-                elif trade_type == "Sell":
-                    trade_counts[ticker]["sell"] += 1
-            for ticker, counts in trade_counts.items():
-                ensure_ticker(ticker)
-                directions[ticker]["ark"] = resolve_direction(counts)
-        except Exception as e:
-            logger.warning(f"Direction detection failed for ark: {e}")
-
-    # ── Insiders ─────────────────────────────────────────────────────
-    insiders_file = data_dir / "insiders.json"
-    if insiders_file.exists():
+    # ── Congress / ARK / Insiders: buy vs sell trade counts ─────────
+    for source, filename, type_field, is_buy, is_sell in TRADE_DIRECTION_SPECS:
+        trades_file = data_dir / filename
+        if not trades_file.exists():
+            continue
         try:
-            with open(insiders_file) as f:
-                data = json.load(f)
-            trade_counts = {}
-            for trade in data.get("trades", []):
+            # ticker → [buy count, sell count]
+            trade_counts: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+            for trade in _iter_records(trades_file, "trades"):
                 ticker = (trade.get("ticker") or "").upper().strip()
                 if not ticker:
                     continue
-                tx_type = trade.get("transaction_type", "")
-                if ticker not in trade_counts:
-                    trade_counts[ticker] = {"buy": 0, "sell": 0}
-                if tx_type == "Buy":
-                    trade_counts[ticker]["buy"] += 1
-                elif tx_type in ("Sale", "Sell"):
-                    trade_counts[ticker]["sell"] += 1
+                ticker = intern(ticker)
+                trade_type = trade.get(type_field, "")
+                counts = trade_counts[ticker]
+                if is_buy(trade_type):
+                    counts[0] += 1
+                elif is_sell(trade_type):
+                    counts[1] += 1
             for ticker, counts in trade_counts.items():
                 ensure_ticker(ticker)
-                directions[ticker]["insider"] = resolve_direction(counts)
+                directions[ticker][source] = resolve_direction(counts)
         except Exception as e:
-            logger.warning(f"Direction detection failed for insider: {e}")
+            logger.warning(f"Direction detection failed for {source}: {e}")
 
     # ── Superinvestors ──────────────────────────────────────────────
     superinvestors_file = data_dir / "superinvestors.json"
     if superinvestors_file.exists():
         try:
-            with open(superinvestors_file) as f:
-                data = json.load(f)
             # Prefer aggregate manager counts; fall back to per_manager counts
-            agg_counts: Dict[str, Dict[str, int]] = {}
-            per_manager_counts: Dict[str, Dict[str, int]] = {}
+            # ticker → [buy, sell]
+            agg_counts: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+            per_manager_counts: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
 
-            for entry in data.get("activity", []):
+            for entry in _iter_records(superinvestors_file, "activity"):
                 ticker = (entry.get("ticker") or "").upper().strip()
                 if not ticker:
                     continue
+                ticker = intern(ticker)
                 activity_type = entry.get("activity_type", "")
                 source = entry.get("source", "")
                 manager_count = entry.get("manager_count", 1)
 
                 if source == "aggregate":
-                    if ticker not in agg_counts:
-                        agg_counts[ticker] = {"buy": 0, "sell": 0}
+                    counts = agg_counts[ticker]
                     if activity_type in ("Buy", "Add"):
-                        agg_counts[ticker]["buy"] = max(
-                            agg_counts[ticker]["buy"], manager_count
-                        )
+                        counts[0] = max(counts[0], manager_count)
                     elif activity_type in ("Sell", "Reduce"):
-                        agg_counts[ticker]["sell"] = max(
-                            agg_counts[ticker]["sell"], manager_count
-                        )
+                        counts[1] = max(counts[1], manager_count)
                 elif source == "per_manager":
-                    if ticker not in per_manager_counts:
-                        per_manager_counts[ticker] = {"buy": 0, "sell": 0}
+                    counts = per_manager_counts[ticker]
                     if activity_type in ("Buy", "Add"):
-                        per_manager_counts[ticker]["buy"] += 1
+                        counts[0] += 1
                     elif activity_type in ("Sell", "Reduce"):
-                        per_manager_counts[ticker]["sell"] += 1
+                        counts[1] += 1
 
             all_si_tickers = set(list(agg_counts.keys()) + list(per_manager_counts.keys()))
             for ticker in all_si_tickers:
                 ensure_ticker(ticker)
-                counts = agg_counts.get(ticker) or per_manager_counts.get(ticker, {"buy": 0, "sell": 0})
+                counts = agg_counts.get(ticker) or per_manager_counts.get(ticker, [0, 0])
                 directions[ticker]["superinvestor"] = resolve_direction(counts)
         except Exception as e:
             logger.warning(f"Direction detection failed for superinvestor: {e}")
@@ -222,20 +219,22 @@ def _score_v7(
     if not sources:
         return 0.0, {"dominant": "none", "contributions": []}
 
+    # (source, bit, weight, conviction, direction), looked up once per source.
     # Assign direction per source: always_neutral overrides detected direction
-    directions: Dict[str, str] = {}
-    for src in sources:
-        if src in ALWAYS_NEUTRAL:
-            directions[src] = "neutral"
+    scored: List[tuple] = []
+    for src, conv in sources.items():
+        bit = SOURCE_BITS.get(src, 0)
+        if bit & ALWAYS_NEUTRAL_MASK:
+            d = "neutral"
         else:
-            directions[src] = ticker_directions.get(src, "neutral")
+            d = ticker_directions.get(src, "neutral")
+        scored.append((src, bit, WEIGHTS.get(src, 10), conv, d))
 
     # ── Step 1: Determine dominant direction ─────────────────────────
     dir_votes: Dict[str, float] = {"bullish": 0.0, "bearish": 0.0}
-    for src, conv in sources.items():
-        d = directions[src]
+    for _, _, weight, conv, d in scored:
         if d in dir_votes:
-            dir_votes[d] += WEIGHTS.get(src, 10) * conv
+            dir_votes[d] += weight * conv
 
     if dir_votes["bullish"] == 0 and dir_votes["bearish"] == 0:
         dominant = "none"
@@ -245,11 +244,12 @@ def _score_v7(
         dominant = "bearish"
 
     # ── Step 2: Classify contributions ──────────────────────────────
-    contributions = []
-    for src, conv in sources.items():
-        weight = WEIGHTS.get(src, 10)
-        d = directions[src]
-
+    # (source, weight, conviction, effective_conviction, contribution, status, direction)
+    contributions: List[tuple] = []
+    contribution_rows: List[dict] = []   # the same, rounded for JSON output
+    aligned_mask = 0   # SOURCE_BITS of aligned sources
+    aligned_total = 0
+    for src, bit, weight, conv, d in scored:
         if d == "neutral" or dominant == "none":
             effective_conviction = conv * NEUTRAL_BASE_DISCOUNT
             contribution = weight * effective_conviction / 100
@@ -258,29 +258,32 @@ def _score_v7(
             effective_conviction = conv
             contribution = weight * conv / 100
             status = "aligned"
+            aligned_mask |= bit
+            aligned_total += 1
         else:
             # Opposing: negative contribution, excluded from positive sorting
             effective_conviction = 0.0
             contribution = -(weight * conv / 100 * 0.7)
             status = "opposing"
 
-        contributions.append({
+        contributions.append((src, weight, conv, effective_conviction, contribution, status, d))
+        contribution_rows.append({
             "source": src,
             "weight": weight,
             "conviction": conv,
-            "effective_conviction": effective_conviction,
-            "contribution": contribution,
+            "effective_conviction": round(effective_conviction, 2),
+            "contribution": round(contribution, 2),
             "status": status,
             "direction": d,
         })
 
     # ── Step 3: Base score from top-2 positive contributions ─────────
     positive = sorted(
-        [c for c in contributions if c["status"] in ("aligned", "neutral")],
-        key=lambda c: c["effective_conviction"],
+        [c for c in contributions if c[5] != "opposing"],
+        key=itemgetter(3),
         reverse=True,
     )
-    opposing = [c for c in contributions if c["status"] == "opposing"]
+    opposing = [c for c in contributions if c[5] == "opposing"]
 
     if not positive:
         return 0.0, {
@@ -289,18 +292,18 @@ def _score_v7(
             "base": 0,
             "extra": 0,
             "dir_bonus": 0,
-            "penalty": round(sum(abs(c["contribution"]) for c in opposing), 2),
+            "penalty": round(sum(abs(c[4]) for c in opposing), 2),
             "cap": 50,
             "aligned_active": 0,
             "aligned_passive": 0,
-            "contributions": _format_contributions(contributions),
+            "contributions": contribution_rows,
         }
 
     top2 = positive[:2]
     remaining = positive[2:]
 
-    top2_contrib_sum = sum(c["contribution"] for c in top2)
-    top2_weight_sum = sum(c["weight"] for c in top2)
+    top2_contrib_sum = sum(c[4] for c in top2)
+    top2_weight_sum = sum(c[1] for c in top2)
     base = (top2_contrib_sum / top2_weight_sum * 100) if top2_weight_sum > 0 else 0
 
     # ── Step 4: Extra source bonus (diminishing returns) ─────────────
@@ -308,27 +311,21 @@ def _score_v7(
     extra = 0.0
     for i, c in enumerate(remaining):
         rate = rates[i] if i < len(rates) else rates[-1]
-        extra += c["contribution"] * rate
+        extra += c[4] * rate
 
     # ── Step 5: Direction alignment bonus ────────────────────────────
-    aligned_active = sum(
-        1 for c in contributions
-        if c["status"] == "aligned" and c["source"] in ACTIVE_SOURCES
-    )
-    aligned_passive = sum(
-        1 for c in contributions
-        if c["status"] == "aligned" and c["source"] not in ACTIVE_SOURCES
-    )
+    aligned_active = (aligned_mask & ACTIVE_MASK).bit_count()
+    aligned_passive = aligned_total - aligned_active
     dir_bonus = max(aligned_active - 1, 0) * 6 + aligned_passive * 2
 
     # ── Step 6: Penalty from opposing ────────────────────────────────
-    penalty = sum(abs(c["contribution"]) for c in opposing)
+    penalty = sum(abs(c[4]) for c in opposing)
 
     # ── Step 7: Cap by source count ────────────────────────────────
     # Uses BOTH aligned_active and total_sources to set cap
     # This ensures multi-source tickers aren't penalized just because
     # direction detection couldn't determine alignment (e.g., mixed buy/sell)
-    total_sources = len([c for c in contributions if c["status"] != "opposing"])
+    total_sources = len(positive)
     cap_by_aligned = {0: 40, 1: 55, 2: 85, 3: 95}.get(aligned_active, 100)
     cap_by_total = {1: 45, 2: 65, 3: 80, 4: 92, 5: 97}.get(min(total_sources, 5), 100)
     cap = max(cap_by_aligned, cap_by_total)  # take the more generous cap
@@ -355,28 +352,12 @@ def _score_v7(
         "cap": cap,
         "aligned_active": aligned_active,
         "aligned_passive": aligned_passive,
-        "contributions": _format_contributions(contributions),
+        "contributions": contribution_rows,
     }
 
     return round(score, 1), breakdown
 
 
-def _format_contributions(contributions: list) -> list:
-    """Serialize contribution dicts for JSON output."""
-    return [
-        {
-            "source": c["source"],
-            "weight": c["weight"],
-            "conviction": c["conviction"],
-            "effective_conviction": round(c["effective_conviction"], 2),
-            "contribution": round(c["contribution"], 2),
-            "status": c["status"],
-            "direction": c["direction"],
-        }
-        for c in contributions
-    ]
-
-
 # ── Public API ───────────────────────────────────────────────────────
 
 def rank_v7(
@@ -403,19 +384,28 @@ def rank_v7(
 
     ranked = []
     for signal in v2_results:
-        ticker = signal.get("ticker", "")
+        get = signal.get
+        ticker = get("ticker", "")
         if not ticker:
             continue
-
-        # Extract per-source conviction scores from V2 output
+        ticker = sys.intern(ticker)
+
+        # Extract per-source conviction scores from V2 output (once; reused below)
+        congress_score = get("congress_score", 0)
+        ark_score = get("ark_score", 0)
+        darkpool_score = get("darkpool_score", 0)
+        institution_score = get("institution_score", 0)
+        insider_score = get("insider_score", 0)
+        superinvestor_score = get("superinvestor_score", 0)
+        short_interest_score = get("short_interest_score", 0)
         source_convictions = {
-            "congress":      signal.get("congress_score", 0),
-            "ark":           signal.get("ark_score", 0),
-            "darkpool":      signal.get("darkpool_score", 0),
-            "institution":   signal.get("institution_score", 0),
-            "insider":       signal.get("insider_score", 0),
-            "superinvestor": signal.get("superinvestor_score", 0),
-            "short_interest":signal.get("short_interest_score", 0),
+            "congress":      congress_score,
+            "ark":           ark_score,
+            "darkpool":      darkpool_score,
+            "institution":   institution_score,
+            "insider":       insider_score,
+            "superinvestor": superinvestor_score,
+            "short_interest":short_interest_score,
         }
 
         ticker_directions = directions.get(ticker, {})
@@ -429,30 +419,30 @@ def rank_v7(
         ranked.append({
             # Identity
             "ticker":       ticker,
-            "company":      signal.get("company", ""),
+            "company":      get("company", ""),
             # Scores
             "score":        v7_score,
-            "v2_score":     signal.get("score", 0),
+            "v2_score":     get("score", 0),
             # Direction
             "direction":    breakdown.get("dominant", "none"),
             # Source metadata (same as V2)
-            "sources":      signal.get("sources", []),
-            "source_count": signal.get("source_count", 0),
-            "signal_date":  signal.get("signal_date", ""),
+            "sources":      get("sources", []),
+            "source_count": get("source_count", 0),
+            "signal_date":  get("signal_date", ""),
             # Per-source conviction scores
-            "congress_score":       signal.get("congress_score", 0),
-            "ark_score":            signal.get("ark_score", 0),
-            "darkpool_score":       signal.get("darkpool_score", 0),
-            "institution_score":    signal.get("institution_score", 0),
-            "insider_score":        signal.get("insider_score", 0),
-            "superinvestor_score":  signal.get("superinvestor_score", 0),
-            "short_interest_score": signal.get("short_interest_score", 0),
+            "congress_score":       congress_score,
+            "ark_score":            ark_score,
+            "darkpool_score":       darkpool_score,
+            "institution_score":    institution_score,
+            "insider_score":        insider_score,
+            "superinvestor_score":  superinvestor_score,
+            "short_interest_score": short_interest_score,
             # V7-specific fields
             "multi_source_bonus": multi_source_bonus,
-            "max_conviction":     signal.get("max_conviction", 0),
+            "max_conviction":     get("max_conviction", 0),
             "v7_breakdown":       breakdown,
             # Signal details from V2
-            "details": signal.get("details", []),
+            "details": get("details", []),
         })
 
     # ── Ticker dedup: merge multi-class tickers (GOOG→GOOGL, BRK.B→BRK.A) ──
@@ -506,6 +496,7 @@ def rank_v7(
 def generate_ranking_v3(
     data_dir: Path,
     min_score: float = 0,
+    v2_signals: Optional[List[dict]] = None,
 ) -> dict:
     """
     Full pipeline: load ranking_v2.json → apply V7 → return ranking_v3 structure.
@@ -513,22 +504,24 @@ def generate_ranking_v3(
     This is the convenience entry point used by signal_refresh.py.
 
     Args:
-        data_dir:  Path to data directory
-        min_score: Minimum V7 score to include in output
+        data_dir:   Path to data directory
+        min_score:  Minimum V7 score to include in output
+        v2_signals: V2 signal dicts already in memory (the "signals" list of
+                    ranking_v2.json); ranking_v2.json is only read when omitted
 
     Returns:
         Dict with "signals" list and "metadata" dict — same structure as ranking_v2.json
     """
-    ranking_v2_file = data_dir / "ranking_v2.json"
-    if not ranking_v2_file.exists():
-        logger.error("ranking_v2.json not found — cannot generate V3 ranking")
-        return {"signals": [], "metadata": {"engine": "v3", "total": 0, "error": "ranking_v2.json missing"}}
+    if v2_signals is None:
+        ranking_v2_file = data_dir / "ranking_v2.json"
+        if not ranking_v2_file.exists():
+            logger.error("ranking_v2.json not found — cannot generate V3 ranking")
+            return {"signals": [], "metadata": {"engine": "v3", "total": 0, "error": "ranking_v2.json missing"}}
 
-    with open(ranking_v2_file) as f:
-        v2_data = json.load(f)
+        v2_data = _read_json(ranking_v2_file)
 
-    v2_signals = v2_data.get("signals", [])
-    logger.info(f"V7: Loaded {len(v2_signals)} signals from ranking_v2.json")
+        v2_signals = v2_data.get("signals", [])
+        logger.info(f"V7: Loaded {len(v2_signals)} signals from ranking_v2.json")
 
     ranked = rank_v7(v2_signals, data_dir)
 
@@ -551,15 +544,18 @@ def generate_ranking_v3(
 # ── CLI entry point ──────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    import sys
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
     data_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("data")
     output_file = data_dir / "ranking_v3.json"
 
     result = generate_ranking_v3(data_dir)
-    with open(output_file, "w") as f:
-        json.dump(result, f, indent=2)
+    try:
+        import orjson
+        output_file.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    except ImportError:
+        with open(output_file, "w") as f:
+            json.dump(result, f, indent=2)
 
     signals = result["signals"]
     print(f"\n{'='*55}")
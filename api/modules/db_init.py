@@ -5,7 +5,8 @@ Called on FastAPI startup to:
   1. Initialize the DuckDB store singleton
   2. Run the initial refresh (load JSON → DuckDB tables)
   3. Start a background thread that watches for JSON file changes
-     and refreshes tables automatically (every 60s mtime check)
+     and refreshes tables automatically (filesystem events via watchfiles
+     when installed, otherwise a 60s mtime check)
 
 Designed to be robust:
   - If DuckDB is unavailable, logs an error but does not crash the API
@@ -18,7 +19,7 @@ import os
 import threading
 import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,8 @@ WATCHED_FILES = [
     "ranking_v3.json",
 ]
 
+WATCHED_SET = frozenset(WATCHED_FILES)
+
 # How often to check for file changes (seconds)
 REFRESH_INTERVAL = 60
 
@@ -79,6 +82,22 @@ def init_duckdb() -> bool:
     return True
 
 
+def _scan_mtimes(data_dir: Path) -> Dict[str, float]:
+    """mtime of each watched file present in data_dir, from one directory scan."""
+    mtimes: Dict[str, float] = {}
+    try:
+        with os.scandir(data_dir) as it:
+            for entry in it:
+                if entry.name in WATCHED_SET:
+                    try:
+                        mtimes[entry.name] = entry.stat().st_mtime
+                    except OSError:
+                        continue  # removed or dangling symlink
+    except OSError:
+        pass
+    return mtimes
+
+
 def _start_refresh_loop(store) -> None:
     """Start the background file-watcher / refresh loop (daemon thread)."""
     global _refresh_thread_started
@@ -89,46 +108,76 @@ def _start_refresh_loop(store) -> None:
             return
         _refresh_thread_started = True
 
-    def _loop():
-        """Watch JSON files for changes and refresh DuckDB when they change."""
-        try:
-            from api.config import DATA_DIR
-            data_dir = Path(DATA_DIR)
-        except ImportError:
-            data_dir = Path("data")
+    def _refresh(changed_files: List[str]) -> None:
+        logger.info(f"[duckdb] Detected changes in: {changed_files}. Refreshing...")
+        if store._initialized:
+            counts = store.refresh_files(changed_files)
+        else:
+            # The full load never completed (e.g. write lock held): load everything
+            counts = store.refresh_all()
+        total = sum(counts.values())
+        logger.info(f"[duckdb] Auto-refresh complete: {total} rows in {len(counts)} tables")
+
+    def _watch(data_dir: Path) -> None:
+        """Refresh on filesystem events (inotify/FSEvents/...) until watching fails."""
+        from watchfiles import Change, watch
+
+        def _is_watched(change, path: str) -> bool:
+            return change != Change.deleted and os.path.basename(path) in WATCHED_SET
+
+        logger.info("[duckdb] Background refresh watcher started (filesystem events)")
+        # watch() debounces a burst of writes (e.g. one signal refresh) into one batch
+        for changes in watch(data_dir, watch_filter=_is_watched, raise_interrupt=False):
+            names = {os.path.basename(path) for _, path in changes}
+            try:
+                _refresh([fname for fname in WATCHED_FILES if fname in names])
+            except Exception as e:
+                logger.error(f"[duckdb] Background refresh error: {e}", exc_info=True)
+                # Keep running despite errors
 
+    def _poll(data_dir: Path) -> None:
+        """Refresh when a watched file's mtime changes, checked every REFRESH_INTERVAL."""
         logger.info(f"[duckdb] Background refresh loop started (interval: {REFRESH_INTERVAL}s)")
-        mtimes: Dict[str, float] = {}
 
         # Record initial mtimes
-        for fname in WATCHED_FILES:
-            path = data_dir / fname
-            if path.exists():
-                mtimes[fname] = path.stat().st_mtime
+        mtimes = _scan_mtimes(data_dir)
 
         while True:
             time.sleep(REFRESH_INTERVAL)
             try:
+                current = _scan_mtimes(data_dir)
                 changed_files = []
                 for fname in WATCHED_FILES:
-                    path = data_dir / fname
-                    if not path.exists():
+                    mtime = current.get(fname)
+                    if mtime is None:
                         continue
-                    mtime = path.stat().st_mtime
                     if mtimes.get(fname) != mtime:
                         mtimes[fname] = mtime
                         changed_files.append(fname)
 
                 if changed_files:
-                    logger.info(f"[duckdb] Detected changes in: {changed_files}. Refreshing...")
-                    counts = store.refresh_all()
-                    total = sum(counts.values())
-                    logger.info(f"[duckdb] Auto-refresh complete: {total} rows")
+                    _refresh(changed_files)
 
             except Exception as e:
                 logger.error(f"[duckdb] Background refresh error: {e}", exc_info=True)
                 # Keep running despite errors
 
+    def _loop():
+        """Watch JSON files for changes and refresh DuckDB when they change."""
+        try:
+            from api.config import DATA_DIR
+            data_dir = Path(DATA_DIR)
+        except ImportError:
+            data_dir = Path("data")
+
+        try:
+            _watch(data_dir)
+        except ImportError:
+            logger.debug("[duckdb] watchfiles not installed, polling for changes")
+        except Exception as e:
+            logger.warning(f"[duckdb] File watcher unavailable ({e}), polling for changes")
+        _poll(data_dir)
+
     thread = threading.Thread(target=_loop, daemon=True, name="duckdb-refresh")
     thread.start()
 
@@ -17,9 +17,9 @@ Thread safety:
   - Multiple uvicorn workers: only one gets the write lock on startup
 
 Tables:
-  congress_trades      ← congress.json → trades[]
-  ark_trades           ← ark_trades.json → trades[]
-  insider_trades       ← insiders.json → trades[]
+  congress_trades      ← congress.json → trades[] (+ trade_side)
+  ark_trades           ← ark_trades.json → trades[] (+ trade_side)
+  insider_trades       ← insiders.json → trades[] (+ trade_side)
   insider_clusters     ← insiders.json → clusters[]
   darkpool_tickers     ← darkpool.json → tickers[]
   darkpool_anomalies   ← darkpool.json → anomalies[]
@@ -29,6 +29,10 @@ Tables:
   superinvestor_activity ← superinvestors.json → activity[]
   superinvestor_holdings ← superinvestors.json → holdings{} (flattened)
   ranking              ← ranking_v3.json → signals[]
+
+trade_side is the canonical 'buy' / 'sell' (or NULL) form of the raw
+trade_type / transaction_type, computed once at load so filters can
+compare a plain column instead of LOWER(REPLACE(...)) per row.
 """
 
 import json
@@ -40,6 +44,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from api.utils import trade_side
+
 logger = logging.getLogger(__name__)
 
 # ── Global singleton ────────────────────────────────────────────────────────
@@ -99,34 +105,66 @@ class DuckDBStore:
         Thread-safe — only one process/thread refreshes at a time.
         """
         with self._write_lock:
-            try:
-                conn = self._connect_write()
-            except Exception as e:
-                # Another process has write lock — skip refresh, read-only mode
-                logger.info(f"[duckdb] Cannot acquire write lock (another process writing): {e}")
+            counts = self._load_files(list(self.FILE_TABLES))
+            if counts is None:
                 return self._table_counts
 
-            counts: Dict[str, int] = {}
-            try:
-                for filename, tables in self.FILE_TABLES.items():
-                    filepath = self.data_dir / filename
-                    if not filepath.exists():
-                        logger.debug(f"[duckdb] Skipping missing file: {filepath}")
-                        continue
-                    try:
-                        file_counts = self._load_file(conn, filename, filepath)
-                        counts.update(file_counts)
-                    except Exception as e:
-                        logger.error(f"[duckdb] Failed to load {filename}: {e}", exc_info=True)
-
-                self._last_refresh = time.time()
-                self._table_counts = counts
-                self._initialized = True
-                total = sum(counts.values())
-                logger.info(f"[duckdb] Refresh complete: {total} rows in {len(counts)} tables")
-                return counts
-            finally:
-                conn.close()
+            self._last_refresh = time.time()
+            self._table_counts = counts
+            self._initialized = True
+            total = sum(counts.values())
+            logger.info(f"[duckdb] Refresh complete: {total} rows in {len(counts)} tables")
+            return counts
+
+    def refresh_files(self, filenames: List[str]) -> Dict[str, int]:
+        """
+        Reload only the given JSON files (keys of FILE_TABLES) into their tables.
+        Tables of other files are left as they are.
+        Returns {table_name: row_count} for the reloaded tables.
+        """
+        unknown = [f for f in filenames if f not in self.FILE_TABLES]
+        if unknown:
+            raise ValueError(f"Unknown data file(s): {unknown}")
+
+        with self._write_lock:
+            counts = self._load_files(filenames)
+            if counts is None:
+                return {}
+
+            self._last_refresh = time.time()
+            self._table_counts.update(counts)
+            total = sum(counts.values())
+            logger.info(f"[duckdb] Refreshed {filenames}: {total} rows in {len(counts)} tables")
+            return counts
+
+    def _load_files(self, filenames: List[str]) -> Optional[Dict[str, int]]:
+        """
+        Load JSON files into their tables over one write connection.
+        Missing files are skipped. Returns None if the write lock is unavailable.
+        Caller holds self._write_lock.
+        """
+        try:
+            conn = self._connect_write()
+        except Exception as e:
+            # Another process has write lock — skip refresh, read-only mode
+            logger.info(f"[duckdb] Cannot acquire write lock (another process writing): {e}")
+            return None
+
+        counts: Dict[str, int] = {}
+        try:
+            for filename in filenames:
+                filepath = self.data_dir / filename
+                if not filepath.exists():
+                    logger.debug(f"[duckdb] Skipping missing file: {filepath}")
+                    continue
+                try:
+                    file_counts = self._load_file(conn, filename, filepath)
+                    counts.update(file_counts)
+                except Exception as e:
+                    logger.error(f"[duckdb] Failed to load {filename}: {e}", exc_info=True)
+            return counts
+        finally:
+            conn.close()
 
     def refresh_table(self, table_name: str) -> int:
         """
@@ -218,17 +256,17 @@ class DuckDBStore:
             return 0
 
     def _load_congress(self, conn, data: dict) -> Dict[str, int]:
-        trades = data.get("trades", [])
+        trades = _with_trade_side(data.get("trades", []), "trade_type")
         c = self._create_table_from_rows(conn, "congress_trades", trades)
         return {"congress_trades": c}
 
     def _load_ark_trades(self, conn, data: dict) -> Dict[str, int]:
-        trades = data.get("trades", [])
+        trades = _with_trade_side(data.get("trades", []), "trade_type")
         c = self._create_table_from_rows(conn, "ark_trades", trades)
         return {"ark_trades": c}
 
     def _load_insiders(self, conn, data: dict) -> Dict[str, int]:
-        trades = data.get("trades", [])
+        trades = _with_trade_side(data.get("trades", []), "transaction_type")
         clusters = data.get("clusters", [])
         c1 = self._create_table_from_rows(conn, "insider_trades", trades)
         c2 = self._create_table_from_rows(conn, "insider_clusters", clusters)
@@ -331,9 +369,7 @@ class DuckDBStore:
                 result = conn.execute(sql, params)
             else:
                 result = conn.execute(sql)
-            columns = [desc[0] for desc in result.description]
-            rows = result.fetchall()
-            return [dict(zip(columns, row)) for row in rows]
+            return _fetch_dicts(result)
         finally:
             conn.close()
 
@@ -354,9 +390,7 @@ class DuckDBStore:
                     result = conn.execute(sql, params)
                 else:
                     result = conn.execute(sql)
-                columns = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-                results.append([dict(zip(columns, row)) for row in rows])
+                results.append(_fetch_dicts(result))
             return results
         finally:
             conn.close()
@@ -437,6 +471,17 @@ def _normalize_row(row: Dict) -> Dict:
     return out
 
 
+def _fetch_dicts(result) -> List[Dict]:
+    """Materialize a query result as a list of dicts."""
+    columns = [desc[0] for desc in result.description]
+    return [dict(zip(columns, row)) for row in result.fetchall()]
+
+
+def _with_trade_side(rows: List[Dict], field: str) -> List[Dict]:
+    """Copy rows with a `trade_side` column derived from the raw `field`."""
+    return [dict(r, trade_side=trade_side(r.get(field))) for r in rows]
+
+
 # ── Singleton accessors ────────────────────────────────────────────────────
 
 def init_store(db_path: Optional[str] = None, data_dir: Optional[str] = None) -> "DuckDBStore":
@@ -1,7 +1,9 @@
 """
 Macro / Market Regime routes — Regime Detector, Crisis Dashboard, Cross-Asset Signals
 """
+import heapq
 import logging
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
@@ -112,13 +114,29 @@ def _compute_ma(prices: list[float], window: int) -> float | None:
     return sum(prices[-window:]) / window
 
 
+_REGIME_CACHE_KEY = "regime_v1"
+_regime_lock = threading.Lock()
+
+
 def _get_regime_data() -> dict:
-    """Compute market regime. Cached 1 hour."""
-    CACHE_KEY = "regime_v1"
-    cached = _cached(CACHE_KEY, 3600)
+    """
+    Market regime. Cached 1 hour.
+
+    Shared by the HTTP route and the MCP tool; on a cache miss only one
+    caller fetches, and concurrent callers wait for its result.
+    """
+    cached = _cached(_REGIME_CACHE_KEY, 3600)
     if cached:
         return cached
+    with _regime_lock:
+        cached = _cached(_REGIME_CACHE_KEY, 3600)
+        if cached:
+            return cached
+        return _compute_regime_data()
 
+
+def _compute_regime_data() -> dict:
+    """Compute market regime from VIX, SPY vs MA200 and credit spreads."""
     # --- VIX ---
     vix_val = _fetch_yf_latest("^VIX")
     if vix_val is None:
@@ -202,7 +220,7 @@ def _get_regime_data() -> dict:
         "cached_at": datetime.now(timezone.utc).isoformat(),
     }
 
-    _set_cache(CACHE_KEY, result)
+    _set_cache(_REGIME_CACHE_KEY, result)
     return result
 
 
@@ -694,8 +712,7 @@ def _get_crypto_signals_data() -> dict:
                 continue
             trade = {**t, "category": "stock" if tk in CRYPTO_STOCKS else "etf"}
             ark_trades.append(trade)
-        ark_trades.sort(key=lambda t: t.get("date", ""), reverse=True)
-        ark_trades = ark_trades[:50]
+        ark_trades = heapq.nlargest(50, ark_trades, key=lambda t: t.get("date", ""))
 
     # --- Insider Trades (crypto STOCKS only) ---
     insider_trades = []
@@ -705,8 +722,9 @@ def _get_crypto_signals_data() -> dict:
             t for t in insider_data["trades"]
             if (t.get("ticker") or "").upper() in CRYPTO_STOCKS
         ]
-        insider_trades.sort(key=lambda t: t.get("trade_date") or t.get("filing_date", ""), reverse=True)
-        insider_trades = insider_trades[:30]
+        insider_trades = heapq.nlargest(
+            30, insider_trades, key=lambda t: t.get("trade_date") or t.get("filing_date", "")
+        )
 
     # --- Dark Pool (crypto STOCKS only) ---
     darkpool = []
@@ -761,8 +779,7 @@ def _get_crypto_signals_data() -> dict:
             t for t in congress_data["trades"]
             if (t.get("ticker") or "").upper() in CRYPTO_TICKERS
         ]
-        congress_trades.sort(key=lambda t: t.get("transaction_date", ""), reverse=True)
-        congress_trades = congress_trades[:20]
+        congress_trades = heapq.nlargest(20, congress_trades, key=lambda t: t.get("transaction_date", ""))
 
     # --- Institution Holdings (crypto tickers) ---
     institution_holdings = []
@@ -777,8 +794,7 @@ def _get_crypto_signals_data() -> dict:
                         "filing_date": filing.get("filing_date", ""),
                         "quarter": filing.get("quarter", ""),
                     })
-        institution_holdings.sort(key=lambda h: h.get("value", 0) or 0, reverse=True)
-        institution_holdings = institution_holdings[:30]
+        institution_holdings = heapq.nlargest(30, institution_holdings, key=lambda h: h.get("value", 0) or 0)
 
     # --- Summary ---
     bullish_signals = sum(
@@ -84,17 +84,17 @@ def api_ticker_aggregate(request: Request, symbol: str):
             congress_trades, ark_trades, darkpool_anomalies, institution_holdings, insider_trades, confluence_signals = batch_results
 
             # ARK holdings still from JSON (not in DuckDB - separate file)
-            ark_holdings_data = smart_money_cache.read("ark_holdings.json")
+            ark_holdings_data = smart_money_cache.read_cached("ark_holdings.json")
             ark_holdings = [
                 h for h in ark_holdings_data.get("holdings", [])
                 if h.get("ticker", "").upper() == symbol
             ]
             if not confluence_signals:
-                signals_data = smart_money_cache.read("ranking_v3.json")
+                signals_data = smart_money_cache.read_cached("ranking_v3.json")
                 if not signals_data or not signals_data.get("signals"):
-                    signals_data = smart_money_cache.read("ranking_v2.json")
+                    signals_data = smart_money_cache.read_cached("ranking_v2.json")
                 if not signals_data or not signals_data.get("signals"):
-                    signals_data = smart_money_cache.read("ranking.json")
+                    signals_data = smart_money_cache.read_cached("ranking.json")
                 confluence_signals = [
                     s for s in signals_data.get("signals", [])
                     if s.get("ticker", "").upper() == symbol
@@ -201,47 +201,48 @@ def api_ticker_aggregate(request: Request, symbol: str):
             logger.warning(f"[duckdb] ticker/{symbol} query failed, falling back to JSON: {e}")
 
     # ── JSON fallback ─────────────────────────────────────────────────
-    congress_data = smart_money_cache.read("congress.json")
+    # Read-only use, so unchanged files are served from the parsed-file LRU
+    congress_data = smart_money_cache.read_cached("congress.json")
     congress_trades = [
         t for t in congress_data.get("trades", [])
         if t.get("ticker", "").upper() == symbol
     ]
 
-    ark_trades_data = smart_money_cache.read("ark_trades.json")
+    ark_trades_data = smart_money_cache.read_cached("ark_trades.json")
     ark_trades = [
         t for t in ark_trades_data.get("trades", [])
         if t.get("ticker", "").upper() == symbol
     ]
 
-    ark_holdings_data = smart_money_cache.read("ark_holdings.json")
+    ark_holdings_data = smart_money_cache.read_cached("ark_holdings.json")
     ark_holdings = [
         h for h in ark_holdings_data.get("holdings", [])
         if h.get("ticker", "").upper() == symbol
     ]
 
-    darkpool_data = smart_money_cache.read("darkpool.json")
+    darkpool_data = smart_money_cache.read_cached("darkpool.json")
     darkpool_anomalies = [
         d for d in darkpool_data.get("tickers", [])
         if d.get("ticker", "").upper() == symbol
     ]
 
-    institutions_data = smart_money_cache.read("institutions.json")
+    institutions_data = smart_money_cache.read_cached("institutions.json")
     institution_holdings = [
         f for f in institutions_data.get("filings", [])
         if f.get("ticker", "").upper() == symbol
     ]
 
-    insiders_data = smart_money_cache.read("insiders.json")
+    insiders_data = smart_money_cache.read_cached("insiders.json")
     insider_trades = [
         t for t in insiders_data.get("trades", [])
         if t.get("ticker", "").upper() == symbol
     ]
 
-    signals_data = smart_money_cache.read("ranking_v3.json")
+    signals_data = smart_money_cache.read_cached("ranking_v3.json")
     if not signals_data or not signals_data.get("signals"):
-        signals_data = smart_money_cache.read("ranking_v2.json")
+        signals_data = smart_money_cache.read_cached("ranking_v2.json")
     if not signals_data or not signals_data.get("signals"):
-        signals_data = smart_money_cache.read("ranking.json")
+        signals_data = smart_money_cache.read_cached("ranking.json")
     confluence_signals = [
         s for s in signals_data.get("signals", [])
         if s.get("ticker", "").upper() == symbol
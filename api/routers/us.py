@@ -1,6 +1,7 @@
 """
 US market routes - ARK, 13F, Congress, Dark Pool, Institutions
 """
+import heapq
 import json
 import logging
 import os
@@ -787,7 +788,7 @@ def api_ranking_feed(
 
                 # Top 5 holdings by value for this fund
                 holdings = filing.get("holdings", [])
-                top_5 = sorted(holdings, key=lambda h: h.get("value", 0), reverse=True)[:5]
+                top_5 = heapq.nlargest(5, holdings, key=lambda h: h.get("value", 0))
 
                 for h in top_5:
                     tk = (h.get("ticker") or "").strip()
@@ -1526,7 +1527,7 @@ def api_institutions_filings(
                 "quarter": quarter,
             })
 
-    top_holdings = sorted(flattened, key=lambda x: x.get("value", 0), reverse=True)[:100]
+    top_holdings = heapq.nlargest(100, flattened, key=lambda x: x.get("value", 0))
     if min_value is not None:
         top_holdings = [h for h in top_holdings if h.get("value", 0) >= min_value]
 
@@ -7,6 +7,7 @@ from yfinance. Results are cached in ticker_names.json.
 
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Optional
@@ -40,21 +41,23 @@ def _save_cache(names: dict):
 def _build_from_internal_sources(smart_money_cache) -> dict:
     """Build mapping from ARK + Institutions data."""
     names = {}
+    # Read-only here, so share the parsed files with the MCP tools when possible
+    read = getattr(smart_money_cache, "read_cached", smart_money_cache.read)
     
     # ARK trades
-    ark_data = smart_money_cache.read("ark_trades.json")
+    ark_data = read("ark_trades.json")
     for t in ark_data.get("trades", []):
         if t.get("company") and t.get("ticker"):
             names[t["ticker"]] = t["company"]
     
     # ARK holdings
-    ark_h = smart_money_cache.read("ark_holdings.json")
+    ark_h = read("ark_holdings.json")
     for h in ark_h.get("holdings", []):
         if h.get("company") and h.get("ticker") and h["ticker"] not in names:
             names[h["ticker"]] = h["company"]
     
     # Institution filings (nested holdings)
-    inst = smart_money_cache.read("institutions.json")
+    inst = read("institutions.json")
     for filing in inst.get("filings", []):
         for h in filing.get("holdings", []):
             tk = h.get("ticker", "").strip()
@@ -99,19 +102,30 @@ class TickerNameLookup:
         self._names = _load_cache()
         self._smart_money_cache = smart_money_cache
         self._initialized = False
+        self._init_lock = threading.RLock()
     
     def _ensure_initialized(self):
-        """Lazy init: build from internal sources on first use."""
+        """
+        Lazy init: build from internal sources on first use.
+
+        _initialized is only set once the names are merged, so concurrent
+        first callers wait for the build instead of seeing a partial map.
+        """
         if self._initialized:
             return
-        self._initialized = True
-        
-        if self._smart_money_cache:
-            internal = _build_from_internal_sources(self._smart_money_cache)
-            # Merge: cache wins for existing, internal fills gaps
-            for k, v in internal.items():
-                if k not in self._names:
-                    self._names[k] = v
+        with self._init_lock:
+            if self._initialized:
+                return
+            try:
+                if self._smart_money_cache:
+                    internal = _build_from_internal_sources(self._smart_money_cache)
+                    # Merge: cache wins for existing, internal fills gaps
+                    for k, v in internal.items():
+                        if k not in self._names:
+                            self._names[k] = v
+            finally:
+                # A failed build is not retried on every lookup
+                self._initialized = True
     
     def get(self, ticker: str) -> Optional[str]:
         """Get company name for a ticker."""
@@ -134,10 +148,13 @@ class TickerNameLookup:
     def enrich_list(self, items: list, ticker_field: str = "ticker", name_field: str = "company") -> list:
         """Add company names to a list of dicts."""
         self._ensure_initialized()
+        lookup = self._names.get
         for item in items:
-            tk = item.get(ticker_field, "").upper()
-            if tk and not item.get(name_field):
-                name = self._names.get(tk)
+            if item.get(name_field):
+                continue
+            tk = item.get(ticker_field)
+            if tk:
+                name = lookup(tk.upper())
                 if name:
                     item[name_field] = name
         return items
@@ -6,6 +6,8 @@ No side effects, fully testable.
 """
 
 import re
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
@@ -109,6 +111,56 @@ def normalize_trade_type(raw: str) -> str:
     return raw.strip()
 
 
+def trade_side(raw: Optional[str]) -> Optional[str]:
+    """
+    Canonical lowercase trade side used for filtering: 'buy', 'sell' or None.
+
+    "Purchase" / "Buy"          → "buy"
+    "Sale (Partial)" / "Sell"   → "sell"
+    "Exchange" / "" / None      → None
+    """
+    side = normalize_trade_type(raw or "")
+    if side == "Buy":
+        return "buy"
+    if side == "Sell":
+        return "sell"
+    return None
+
+
+# ── Date Ordinals ─────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=4096)
+def _day_ordinal(day: str) -> int:
+    # Plain YYYY-MM-DD is read with int slices; strptime only sees the
+    # looser forms it also accepts (e.g. unpadded months)
+    try:
+        if (
+            len(day) == 10 and day[4] == "-" and day[7] == "-"
+            and day[:4].isdigit() and day[5:7].isdigit() and day[8:].isdigit()
+        ):
+            return date(int(day[:4]), int(day[5:7]), int(day[8:])).toordinal()
+        return datetime.strptime(day, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return -1
+
+
+def date_ordinal(date_str: str) -> int:
+    """
+    Proleptic Gregorian ordinal of a YYYY-MM-DD[...] string, -1 if unparseable.
+
+    The signal engines re-check the same few hundred trade/filing dates
+    across every row of a cache file, so each distinct date is parsed once.
+
+    "2025-11-14"            → 739569
+    "2025-11-14T09:30:00"   → 739569
+    "bad" / None            → -1
+    """
+    if not isinstance(date_str, str):
+        return -1
+    return _day_ordinal(date_str[:10])
+
+
 # ── ARK Change Type → Trade Type ──────────────────────────────────────
 
 
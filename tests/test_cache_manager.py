@@ -14,6 +14,7 @@ Validates:
 
 import json
 import os
+import sys
 import time
 import pytest
 import tempfile
@@ -99,6 +100,116 @@ class TestReadWrite:
         result = cache.read("large.json")
         assert len(result["items"]) == 10_000
 
+    def test_large_lists_written_in_chunks(self, cache, cache_dir):
+        data = {
+            "metadata": {"count": 2500},
+            "trades": [{"id": i, "big": 2 ** 70 if i == 1500 else i} for i in range(2500)],
+            "empty": [],
+        }
+        with patch("api.modules.cache_manager.STREAM_CHUNK_RECORDS", 1000):
+            assert cache.write("chunked.json", data) is True
+        with open(os.path.join(cache_dir, "chunked.json")) as f:
+            assert json.load(f) == data
+
+    def test_read_via_mmap(self, cache):
+        data = {"items": [{"id": i, "name": "Pelosi 佩洛西"} for i in range(100)]}
+        cache.write("mapped.json", data)
+        with patch("api.modules.cache_manager.MMAP_MIN_BYTES", 1):
+            assert cache.read("mapped.json") == data
+
+    def test_read_via_mmap_legacy_nan(self, cache, cache_dir):
+        with open(os.path.join(cache_dir, "legacy.json"), "w") as f:
+            f.write('{"dpi": NaN, "price": 1.5}')
+        with patch("api.modules.cache_manager.MMAP_MIN_BYTES", 1):
+            assert cache.read("legacy.json")["price"] == 1.5
+
+
+# ── Cached Reads ───────────────────────────────────────────────────────────
+
+
+class TestReadCached:
+    def test_reuses_parsed_object(self, cache):
+        cache.write("test.json", {"trades": [1, 2, 3]})
+        first = cache.read_cached("test.json")
+        assert first == {"trades": [1, 2, 3]}
+        assert cache.read_cached("test.json") is first
+
+    def test_read_returns_fresh_copy(self, cache):
+        cache.write("test.json", {"trades": [1]})
+        cached = cache.read_cached("test.json")
+        assert cache.read("test.json") is not cached
+
+    def test_rewrite_invalidates(self, cache):
+        cache.write("test.json", {"version": 1})
+        assert cache.read_cached("test.json")["version"] == 1
+        cache.write("test.json", {"version": 2})
+        assert cache.read_cached("test.json")["version"] == 2
+
+    def test_external_rewrite_invalidates(self, cache, cache_dir):
+        cache.write("test.json", {"version": 1})
+        assert cache.read_cached("test.json")["version"] == 1
+        # Collector writing the file directly (new inode via rename)
+        tmp = os.path.join(cache_dir, "other.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"version": 22}, f)
+        os.replace(tmp, os.path.join(cache_dir, "test.json"))
+        assert cache.read_cached("test.json")["version"] == 22
+
+    def test_deleted_file_returns_empty(self, cache):
+        cache.write("test.json", {"version": 1})
+        cache.read_cached("test.json")
+        cache.delete("test.json")
+        assert cache.read_cached("test.json") == {}
+
+    def test_nonexistent_returns_empty(self, cache):
+        assert cache.read_cached("nonexistent.json") == {}
+
+    def test_top_level_is_read_only(self, cache):
+        cache.write("test.json", {"trades": [1]})
+        with pytest.raises(TypeError):
+            cache.read_cached("test.json")["trades"] = []
+
+    def test_least_recently_used_evicted(self, cache_dir):
+        small = CacheManager(cache_dir, max_parsed=2)
+        for name in ("a.json", "b.json", "c.json"):
+            small.write(name, {"name": name})
+        a = small.read_cached("a.json")
+        small.read_cached("b.json")
+        small.read_cached("a.json")  # a is now most recent
+        small.read_cached("c.json")  # evicts b
+        assert small.read_cached("a.json") is a
+        with patch.object(small, "read", wraps=small.read) as mock_read:
+            small.read_cached("b.json")
+            mock_read.assert_called_once_with("b.json")
+
+    def test_invalidate_forces_reparse(self, cache):
+        cache.write("test.json", {"version": 1})
+        first = cache.read_cached("test.json")
+        cache.invalidate("test.json")
+        assert cache.read_cached("test.json") is not first
+
+    def test_low_cardinality_fields_interned(self, cache):
+        ticker = "".join(["NV", "DA"])  # built at runtime, so not already interned
+        cache.write("a.json", {"trades": [{"ticker": ticker, "note": "x"}]})
+        cache.write("b.json", {"signals": [{"ticker": ticker, "details": [{"source": "ark"}]}]})
+        a = cache.read_cached("a.json")["trades"][0]["ticker"]
+        b = cache.read_cached("b.json")["signals"][0]["ticker"]
+        assert a is b
+        assert cache.read_cached("b.json")["signals"][0]["details"][0]["source"] is sys.intern("ark")
+
+    def test_non_object_returns_empty(self, cache, cache_dir):
+        with open(os.path.join(cache_dir, "array.json"), "w") as f:
+            json.dump([1, 2, 3], f)
+        assert cache.read_cached("array.json") == {}
+
+    def test_invalid_json_not_reparsed(self, cache, cache_dir):
+        with open(os.path.join(cache_dir, "bad.json"), "w") as f:
+            f.write("{not json")
+        assert cache.read_cached("bad.json") == {}
+        with patch.object(cache, "read") as mock_read:
+            assert cache.read_cached("bad.json") == {}
+            mock_read.assert_not_called()
+
 
 # ── Error Handling ─────────────────────────────────────────────────────────
 
@@ -266,10 +377,28 @@ class TestAtomicWrite:
         """Write should return False when OS-level error occurs."""
         from unittest.mock import patch
         
-        with patch("api.modules.cache_manager.tempfile.mkstemp", side_effect=OSError("No space")):
+        with patch("api.modules.cache_manager.os.open", side_effect=OSError("No space")):
             result = cache.write("fail.json", {"data": True})
         assert result is False
 
+    def test_no_temp_file_left_after_write(self, cache, cache_dir):
+        cache.write("clean.json", {"v": 1})
+        cache.write("clean.json", {"v": 2})
+        assert sorted(os.listdir(cache_dir)) == ["clean.json"]
+
+    def test_stale_temp_files_swept_on_startup(self, cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+        # PID far beyond pid_max, so it can't belong to a live process
+        dead = os.path.join(cache_dir, ".a.json.99999999.1.tmp")
+        mine = os.path.join(cache_dir, f".a.json.{os.getpid()}.1.tmp")
+        other = os.path.join(cache_dir, ".a.json.k3j2h1.tmp")
+        for p in (dead, mine, other):
+            open(p, "w").close()
+        CacheManager(cache_dir)
+        assert not os.path.exists(dead)
+        assert os.path.exists(mine)
+        assert os.path.exists(other)
+
     def test_default_str_serializes_objects(self, cache):
         """json.dump with default=str handles non-serializable objects gracefully."""
         from datetime import datetime
@@ -318,3 +447,34 @@ class TestDataIntegrity:
         result = cache.read("dates.json")
         assert result["dates"] == ["2025-01-20", "2025-01-24", "2025-01-25"]
         assert result["timestamp"] == "2025-01-26T22:05:00Z"
+
+    def test_reads_legacy_nan_literals(self, cache, cache_dir):
+        """Files written by json.dump may contain NaN, which strict parsers reject."""
+        with open(os.path.join(cache_dir, "legacy.json"), "w") as f:
+            f.write('{"dpi": NaN, "price": 1.5}')
+        result = cache.read("legacy.json")
+        assert result["price"] == 1.5
+        assert result["dpi"] != result["dpi"]
+
+    def test_writes_nan_and_infinity_as_literals(self, cache, cache_dir):
+        """Non-finite floats keep json.dump's NaN/Infinity, not null."""
+        data = {"rows": [{"dpi": float("nan"), "z": float("inf"), "price": 1.5}]}
+        assert cache.write("nan.json", data) is True
+        with open(os.path.join(cache_dir, "nan.json")) as f:
+            raw = f.read()
+        assert "NaN" in raw and "Infinity" in raw and "null" not in raw
+        row = cache.read("nan.json")["rows"][0]
+        assert row["dpi"] != row["dpi"]
+        assert row["z"] == float("inf")
+        assert row["price"] == 1.5
+
+    def test_huge_integers_roundtrip(self, cache):
+        """Integers beyond 64 bits still serialize."""
+        data = {"big": 2 ** 70}
+        assert cache.write("huge.json", data) is True
+        assert cache.read("huge.json") == data
+
+    def test_datetime_keeps_str_format(self, cache):
+        from datetime import datetime
+        cache.write("dt.json", {"ts": datetime(2025, 1, 20, 12, 0)})
+        assert cache.read("dt.json")["ts"] == str(datetime(2025, 1, 20, 12, 0))
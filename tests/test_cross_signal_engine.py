@@ -200,6 +200,15 @@ class TestCongressExtraction:
         signals = extractor.extract_congress(data)
         assert len(signals) == 2
 
+    def test_missing_or_bad_filing_date_excluded(self, extractor):
+        data = {"trades": [
+            {"ticker": "AAPL", "trade_type": "Buy", "amount_max": 50000,
+             "transaction_date": "", "filing_date": None},
+            {"ticker": "MSFT", "trade_type": "Buy", "amount_max": 50000,
+             "filing_date": "02/10/2026"},
+        ]}
+        assert extractor.extract_congress(data) == []
+
 
 class TestArkExtraction:
     @pytest.fixture
@@ -383,6 +392,37 @@ class TestClustering:
         cluster = engine.find_best_cluster(signals)
         assert len(cluster) == 1
 
+    def test_unparseable_dates_left_out(self):
+        engine = CrossSignalEngine(window_days=7, min_score=0, reference_date="2026-02-13")
+        signals = [
+            RawSignal("X", "congress", "Bullish", "", 1.0, "no date"),
+            RawSignal("X", "ark", "Bullish", "2026-02-10", 1.0, "b"),
+            RawSignal("X", "darkpool", "Bullish", "2026-02-12", 0.8, "c"),
+        ]
+        cluster = engine.find_best_cluster(signals)
+        assert [s.source for s in cluster] == ["ark", "darkpool"]
+        assert engine.score_cluster("X", cluster).signal_date == "2026-02-12"
+
+    def test_cluster_spans_both_sides_of_anchor(self):
+        engine = CrossSignalEngine(window_days=7, min_score=0, reference_date="2026-02-20")
+        signals = [
+            RawSignal("X", "darkpool", "Bullish", "2026-02-15", 0.8, "late"),
+            RawSignal("X", "congress", "Bullish", "2026-02-01", 1.0, "early"),
+            RawSignal("X", "ark", "Bullish", "2026-02-08", 1.0, "middle"),
+        ]
+        cluster = engine.find_best_cluster(signals)
+        # Anchored on 02-08, members kept in input order
+        assert [s.description for s in cluster] == ["late", "early", "middle"]
+
+    def test_tie_keeps_earliest_anchor(self):
+        engine = CrossSignalEngine(window_days=2, min_score=0, reference_date="2026-02-20")
+        signals = [
+            RawSignal("X", "ark", "Bullish", "2026-02-15", 1.0, "a"),
+            RawSignal("X", "congress", "Bullish", "2026-02-01", 1.0, "b"),
+        ]
+        assert [s.description for s in engine.find_best_cluster(signals)] == ["a"]
+        assert [s.description for s in engine.find_best_cluster(signals[::-1])] == ["b"]
+
 
 # ── Scoring Edge Cases ─────────────────────────────────────────────────
 
@@ -408,6 +448,34 @@ class TestScoringEdgeCases:
         result = engine.score_cluster("X", signals)
         assert result.excess_return_bonus == 0
 
+    def test_fused_pipeline_matches_separate_steps(self):
+        engine = CrossSignalEngine(min_score=0, reference_date="2026-02-13")
+        signals = [
+            RawSignal("X", "darkpool", "Bullish", "2026-02-09", 0.8, "weak", {"z_score": 2.1}),
+            RawSignal("X", "congress", "Bullish", "2026-02-10", 1.0, "a", {"excess_return_pct": 4.0}),
+            RawSignal("X", "darkpool", "Bullish", "2026-02-12", 0.8, "strong", {"z_score": 3.5}),
+            RawSignal("X", "congress", "Bullish", "2026-02-11", 1.0, "b", {"excess_return_pct": 9.0}),
+            RawSignal("X", "institution", "Bullish", "2026-01-02", 0.6, "stale", {"value": 9e7}),
+        ]
+        today = engine._today()
+        expected = engine.score_cluster(
+            "X", engine.deduplicate_sources(engine.find_best_cluster(signals)), today
+        )
+        result = engine._cluster_and_score("X", signals, today)
+        assert result == expected
+        assert [s.description for s in result.signals] == ["strong", "a", "b"]
+
+    def test_dedup_keeps_strongest_darkpool_and_institution(self):
+        engine = CrossSignalEngine(min_score=0, reference_date="2026-02-13")
+        signals = [
+            RawSignal("X", "darkpool", "Bullish", "2026-02-10", 0.8, "dp weak", {"z_score": 2.1, "value": 9e9}),
+            RawSignal("X", "darkpool", "Bullish", "2026-02-11", 0.8, "dp strong", {"z_score": 3.4}),
+            RawSignal("X", "institution", "Bullish", "2026-02-10", 0.6, "13f small", {"value": 6e7}),
+            RawSignal("X", "institution", "Bullish", "2026-02-10", 0.6, "13f large", {"value": 2e8}),
+        ]
+        deduped = engine.deduplicate_sources(signals)
+        assert [s.description for s in deduped] == ["dp strong", "13f large"]
+
     def test_old_signal_low_recency(self):
         """Signal from 25 days ago should have low recency multiplier."""
         engine = CrossSignalEngine(min_score=0, reference_date="2026-02-13")
@@ -422,6 +490,13 @@ class TestScoringEdgeCases:
         result = engine.score_cluster("X", signals)
         assert result.excess_return_bonus == 2.0
 
+    def test_explicit_today_matches_reference_date(self):
+        """Passing the run's reference date gives the same score as resolving it per call."""
+        engine = CrossSignalEngine(min_score=0, reference_date="2026-02-13")
+        signals = [RawSignal("X", "congress", "Bullish", "2026-02-05", 1.0, "a")]
+        today = datetime(2026, 2, 13)
+        assert engine.score_cluster("X", signals, today) == engine.score_cluster("X", signals)
+
     def test_score_capped_at_10(self):
         """Maximum score should never exceed 10."""
         engine = CrossSignalEngine(min_score=0, max_possible_score=5.0, reference_date="2026-02-13")
@@ -0,0 +1,126 @@
+"""
+Tests for FINRA dark pool anomaly scoring (api.collectors.darkpool).
+
+Validates:
+- Z-scores match the per-ticker statistics.mean/stdev computation
+- Windows shorter than MIN_HISTORY_DAYS are skipped
+- Windows are capped at Z_SCORE_WINDOW days
+- Constant series hit the 0.001 std clamp
+- Anomaly flags (Z ≥ 2.0 AND DPI ≥ 0.4 AND volume ≥ 500K AND ≤7 days old)
+"""
+
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from api.collectors.darkpool import (  # noqa: E402
+    MIN_HISTORY_DAYS,
+    Z_SCORE_WINDOW,
+    compute_anomalies,
+)
+
+
+DAYS = 45
+
+
+def _series(length, fn):
+    """{date: dpi} for the last `length` of DAYS days ending today."""
+    start = datetime.now() - timedelta(days=DAYS - 1)
+    dates = [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(DAYS)]
+    return {d: fn(i) for i, d in enumerate(dates[-length:])}
+
+
+@pytest.fixture
+def history():
+    rng = random.Random(7)
+    series = {
+        # Below MIN_HISTORY_DAYS: never scored
+        "SHRT": _series(MIN_HISTORY_DAYS - 5, lambda i: 0.5),
+        # Longer than Z_SCORE_WINDOW, spikes on the last day
+        "LONG": _series(DAYS, lambda i: 0.8 if i == DAYS - 1 else 0.45 + rng.uniform(-0.05, 0.05)),
+        # Between the two: window of MIN_HISTORY_DAYS + 4 values
+        "MIDL": _series(MIN_HISTORY_DAYS + 5, lambda i: 0.3 + rng.uniform(-0.1, 0.1)),
+        # Constant window, small move on the last day: std clamped to 0.001
+        "FLAT": _series(DAYS - 5, lambda i: 0.6 if i == DAYS - 6 else 0.5),
+        # Fully constant: clamp with a zero numerator
+        "CNST": _series(DAYS, lambda i: 0.5),
+    }
+    dates = sorted({d for s in series.values() for d in s})
+    return [
+        (
+            d,
+            {
+                t: {"dpi": s[d], "short_volume": int(s[d] * 1_000_000), "total_volume": 1_000_000}
+                for t, s in series.items() if d in s
+            },
+        )
+        for d in dates
+    ]
+
+
+def _reference_z_scores(history):
+    """The per-ticker statistics-based computation compute_anomalies replaced."""
+    per_ticker = {}
+    for _, day_data in history:
+        for ticker, values in day_data.items():
+            per_ticker.setdefault(ticker, []).append(values["dpi"])
+
+    z_scores = {}
+    for ticker, dpis in per_ticker.items():
+        if len(dpis) < MIN_HISTORY_DAYS:
+            continue
+        if len(dpis) >= Z_SCORE_WINDOW + 1:
+            window_dpis = dpis[-(Z_SCORE_WINDOW + 1):-1]
+        else:
+            window_dpis = dpis[:-1]
+        if len(window_dpis) < MIN_HISTORY_DAYS:
+            continue
+        mean_dpi = statistics.mean(window_dpis)
+        std_dpi = statistics.stdev(window_dpis) if len(window_dpis) > 1 else 0.001
+        if std_dpi < 0.001:
+            std_dpi = 0.001
+        z_scores[ticker] = (dpis[-1] - mean_dpi) / std_dpi
+    return z_scores
+
+
+class TestComputeAnomalies:
+    def test_z_scores_match_statistics(self, history):
+        expected = _reference_z_scores(history)
+        all_latest, _ = compute_anomalies(history)
+
+        assert {e["ticker"]: e["z_score"] for e in all_latest} == {
+            t: round(z, 2) for t, z in expected.items()
+        }
+
+    def test_short_history_skipped(self, history):
+        all_latest, _ = compute_anomalies(history)
+        assert "SHRT" not in {e["ticker"] for e in all_latest}
+
+    def test_std_clamp(self, history):
+        all_latest, _ = compute_anomalies(history)
+        by_ticker = {e["ticker"]: e for e in all_latest}
+        assert by_ticker["FLAT"]["z_score"] == pytest.approx(100.0)
+        assert by_ticker["CNST"]["z_score"] == 0.0
+
+    def test_anomaly_flags_match_statistics(self, history):
+        expected = _reference_z_scores(history)
+        latest = {t: d for _, day in history for t, d in day.items()}
+        expected_flags = {
+            t for t, z in expected.items()
+            if z >= 2.0 and latest[t]["dpi"] >= 0.4 and latest[t]["total_volume"] >= 500_000
+        }
+
+        _, anomalies = compute_anomalies(history)
+
+        assert {e["ticker"] for e in anomalies} == expected_flags
+        assert expected_flags == {"LONG", "FLAT"}
+
+    def test_sorted_by_z_score(self, history):
+        all_latest, anomalies = compute_anomalies(history)
+        for rows in (all_latest, anomalies):
+            z = [e["z_score"] for e in rows]
+            assert z == sorted(z, reverse=True)
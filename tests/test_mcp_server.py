@@ -14,7 +14,8 @@ import asyncio
 import json
 import os
 import sys
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -250,6 +251,7 @@ def mock_shared_imports(monkeypatch):
         return sample_data.get(filename, {})
 
     mock_cache.read = mock_read
+    mock_cache.read_cached = mock_read
 
     # Mock ticker_names
     mock_tn = MagicMock()
@@ -299,6 +301,38 @@ class TestMCPServerToolListing:
             assert tool.description, f"Tool {tool.name} missing description"
             assert len(tool.description) > 20, f"Tool {tool.name} description too short: {tool.description}"
 
+    def test_call_tool_returns_compact_json(self):
+        from api.mcp_server import mcp, get_ark_holdings
+        content = asyncio.run(mcp.call_tool("get_ark_holdings", {"etf": "ARKK"}))
+        assert len(content) == 1
+        text = content[0].text
+        assert "\n" not in text
+        assert json.loads(text) == get_ark_holdings(etf="ARKK")
+
+    def test_concurrent_identical_calls_share_one_run(self, monkeypatch):
+        from api.mcp_server import mcp, _get_cache
+        real = _get_cache()
+        reads = []
+
+        def slow_read(filename):
+            reads.append(filename)
+            time.sleep(0.05)
+            return real.read_cached(filename)
+
+        cache = MagicMock()
+        cache.read_cached = slow_read
+        monkeypatch.setattr("api.mcp_server._get_cache", lambda: cache)
+
+        async def burst():
+            same = [mcp.call_tool("get_ark_holdings", {"etf": "ARKK"}) for _ in range(3)]
+            other = mcp.call_tool("get_ark_holdings", {"etf": "ARKW"})
+            return await asyncio.gather(*same, other)
+
+        results = asyncio.run(burst())
+        assert len(reads) == 2  # one per distinct argument set
+        assert len({r[0].text for r in results[:3]}) == 1
+        assert results[3][0].text != results[0][0].text
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 2. Individual Tool Unit Tests
@@ -336,6 +370,87 @@ class TestCongressTrades:
             tt = t.get("trade_type", "").lower().replace("sale", "sell")
             assert tt in ("purchase", "buy")
 
+    def _unnamed_trades(self, monkeypatch):
+        cache = MagicMock()
+        trades = [
+            {"ticker": "A", "party": "Democrat", "transaction_date": "9999-01-01"},
+            {"ticker": "B", "party": "Republican", "transaction_date": "9999-01-01"},
+        ]
+        cache.read_cached = lambda f: {"trades": trades}
+        monkeypatch.setattr("api.mcp_server._get_cache", lambda: cache)
+        return trades
+
+    @staticmethod
+    def _name_lookup(initialized=True):
+        tn = MagicMock()
+        tn._initialized = initialized
+
+        def enrich_list(items, **kwargs):
+            for item in items:
+                item["company"] = f"{item['ticker']} Corp"
+        tn.enrich_list.side_effect = enrich_list
+        return tn
+
+    def test_enriches_cached_rows_once(self, monkeypatch):
+        from api.mcp_server import get_congress_trades
+        trades = self._unnamed_trades(monkeypatch)
+        tn = self._name_lookup()
+        monkeypatch.setattr("api.mcp_server._get_ticker_names", lambda: tn)
+        dem = get_congress_trades(party="Democrat")["trades"]
+        rep = get_congress_trades(party="Republican")["trades"]
+        assert [t["company"] for t in dem + rep] == ["A Corp", "B Corp"]
+        assert tn.enrich_list.call_count == 1
+        assert all("company" not in t for t in trades)  # shared cached rows untouched
+
+    def test_enrichment_not_memoized_until_lookup_ready(self, monkeypatch):
+        from api.mcp_server import get_congress_trades
+        self._unnamed_trades(monkeypatch)
+        tn = self._name_lookup(initialized=False)
+        monkeypatch.setattr("api.mcp_server._get_ticker_names", lambda: tn)
+        get_congress_trades(party="Democrat")
+        get_congress_trades(party="Democrat")
+        assert tn.enrich_list.call_count == 2
+
+    def test_failed_enrichment_is_retried(self, monkeypatch):
+        from api.mcp_server import get_congress_trades
+        self._unnamed_trades(monkeypatch)
+        tn = self._name_lookup()
+        fill = tn.enrich_list.side_effect
+        tn.enrich_list.side_effect = RuntimeError("lookup down")
+        monkeypatch.setattr("api.mcp_server._get_ticker_names", lambda: tn)
+        assert "company" not in get_congress_trades(party="Democrat")["trades"][0]
+        tn.enrich_list.side_effect = fill
+        assert get_congress_trades(party="Democrat")["trades"][0]["company"] == "A Corp"
+
+    def test_trade_type_matches_canonical_side(self, monkeypatch):
+        from api.mcp_server import get_congress_trades
+        cache = MagicMock()
+        trades = [
+            {"ticker": "A", "trade_type": "Buy", "transaction_date": "9999-01-01"},
+            {"ticker": "B", "trade_type": "Sale (Partial)", "transaction_date": "9999-01-01"},
+            {"ticker": "C", "trade_type": "Exchange", "transaction_date": "9999-01-01"},
+        ]
+        cache.read_cached = lambda f: {"trades": trades}
+        monkeypatch.setattr("api.mcp_server._get_cache", lambda: cache)
+        assert [t["ticker"] for t in get_congress_trades(trade_type="Purchase")["trades"]] == ["A"]
+        assert [t["ticker"] for t in get_congress_trades(trade_type="Sale")["trades"]] == ["B"]
+        assert [t["ticker"] for t in get_congress_trades(trade_type="exchange")["trades"]] == ["C"]
+
+    def test_combined_filters_keep_order_and_limit(self, monkeypatch):
+        from api.mcp_server import get_congress_trades
+        cache = MagicMock()
+        trades = [
+            {"ticker": "A", "party": "Democrat", "chamber": "House", "transaction_date": "9999-01-03"},
+            {"ticker": "B", "party": None, "chamber": "House", "transaction_date": "9999-01-02"},
+            {"ticker": "C", "party": "Democrat", "chamber": "Senate", "transaction_date": "9999-01-02"},
+            {"ticker": "D", "party": "democrat", "chamber": "house", "transaction_date": "9999-01-01"},
+            {"ticker": "E", "party": "Democrat", "chamber": "House", "transaction_date": "9999-01-01"},
+        ]
+        cache.read_cached = lambda f: {"trades": trades}
+        monkeypatch.setattr("api.mcp_server._get_cache", lambda: cache)
+        result = get_congress_trades(party="DEMOCRAT", chamber="House", limit=2)
+        assert [t["ticker"] for t in result["trades"]] == ["A", "D"]
+
     def test_buy_sell_counts(self):
         from api.mcp_server import get_congress_trades
         result = get_congress_trades(days=365)
@@ -453,6 +568,20 @@ class TestInsiderTrades:
         assert "sell_count" in meta
         assert "cluster_count" in meta
 
+    def test_ticker_filter_case_insensitive(self):
+        from api.mcp_server import get_insider_trades
+        result = get_insider_trades(ticker="aapl", days=365)
+        assert [t["ticker"] for t in result["trades"]] == ["AAPL"]
+        assert [c["ticker"] for c in result["clusters"]] == ["AAPL"]
+
+    def test_days_cutoff_on_newest_first_trades(self):
+        from api.mcp_server import get_insider_trades
+        # Sample trades are stored newest-first, so the cutoff is a binary search
+        result = get_insider_trades(days=3)
+        assert [t["ticker"] for t in result["trades"]] == ["AAPL"]
+        result = get_insider_trades(days=30)
+        assert [t["ticker"] for t in result["trades"]] == ["AAPL", "NVDA"]
+
 
 class TestInstitutionalFilings:
     def test_returns_filings_and_holdings(self):
@@ -482,6 +611,12 @@ class TestInstitutionalFilings:
         for h in result["top_holdings"]:
             assert h.get("ticker"), f"Holding missing ticker: {h}"
 
+    def test_top_holdings_ranked_by_value(self):
+        from api.mcp_server import get_13f_filings
+        result = get_13f_filings(fund="berkshire", limit=1)
+        assert [h["ticker"] for h in result["top_holdings"]] == ["AAPL"]
+        assert result["top_holdings"][0]["pct_portfolio"] == pytest.approx(30.0)
+
 
 class TestDarkpoolActivity:
     def test_returns_anomalies(self):
@@ -490,6 +625,12 @@ class TestDarkpoolActivity:
         assert "anomalies" in result
         assert "metadata" in result
 
+    def test_sorted_by_zscore(self):
+        from api.mcp_server import get_darkpool_activity
+        result = get_darkpool_activity(min_zscore=0, min_dpi=0, days=30)
+        scores = [a["z_score"] for a in result["anomalies"]]
+        assert scores == sorted(scores, reverse=True)
+
     def test_zscore_filter(self):
         from api.mcp_server import get_darkpool_activity
         result = get_darkpool_activity(min_zscore=3.0)
@@ -579,6 +720,11 @@ class TestSuperinvestorActivity:
             for a in result["activity"]
         )
 
+    def test_buy_sell_counts(self):
+        from api.mcp_server import get_superinvestor_activity
+        meta = get_superinvestor_activity()["metadata"]
+        assert (meta["buy_count"], meta["sell_count"]) == (1, 1)
+
 
 class TestConfluenceSignals:
     def test_returns_signals(self):
@@ -615,6 +761,51 @@ class TestConfluenceSignals:
         result = get_confluence_signals(min_score=0)
         assert "engine" in result["metadata"]
 
+    def test_falls_back_to_older_ranking(self, monkeypatch):
+        from api.mcp_server import get_confluence_signals
+        files = {"ranking_v2.json": {"signals": [{"ticker": "V2", "score": 50, "signal_date": "9999-01-01"}],
+                                     "metadata": {"engine": "v2"}}}
+        cache = MagicMock()
+        cache.read_cached = MagicMock(side_effect=lambda f: files.get(f, {}))
+        cache.exists = lambda f: f in files
+        monkeypatch.setattr("api.mcp_server._get_cache", lambda: cache)
+
+        assert get_confluence_signals()["metadata"]["engine"] == "v2"
+        # Resolved file is reused without re-reading the missing V3 file
+        cache.read_cached.reset_mock()
+        assert [s["ticker"] for s in get_confluence_signals()["signals"]] == ["V2"]
+        assert [c.args[0] for c in cache.read_cached.call_args_list] == ["ranking_v2.json"]
+
+        # A V3 file appearing takes priority again
+        files["ranking_v3.json"] = {"signals": [{"ticker": "V3", "score": 50, "signal_date": "9999-01-01"}]}
+        assert [s["ticker"] for s in get_confluence_signals()["signals"]] == ["V3"]
+
+    def test_min_score_cut_is_exact(self, monkeypatch):
+        from api.mcp_server import get_confluence_signals
+        cache = MagicMock()
+        signals = [{"ticker": t, "score": sc, "signal_date": "9999-01-01"}
+                   for t, sc in [("A", 10.0), ("B", 70.0), ("C", 40.0), ("D", 40.0), ("E", 39.9)]]
+        cache.read_cached = lambda f: {"signals": signals} if f == "ranking_v3.json" else {}
+        monkeypatch.setattr("api.mcp_server._get_cache", lambda: cache)
+        result = get_confluence_signals(min_score=40.0)
+        assert [s["ticker"] for s in result["signals"]] == ["B", "C", "D"]
+        assert result["metadata"]["total"] == 5
+
+    def test_source_filter_matches_details_or_sources(self, monkeypatch):
+        from api.mcp_server import get_confluence_signals
+        cache = MagicMock()
+        signals = [
+            {"ticker": "A", "score": 90, "signal_date": "9999-01-01", "details": [{"source": "ark"}]},
+            {"ticker": "B", "score": 80, "signal_date": "9999-01-01", "sources": ["darkpool"]},
+            {"ticker": "C", "score": 70, "signal_date": "9999-01-01", "details": [{"source": "congress"}]},
+            {"ticker": "D", "score": 60, "signal_date": "2000-01-01", "sources": ["ark"]},
+        ]
+        cache.read_cached = lambda f: {"signals": signals} if f == "ranking_v3.json" else {}
+        monkeypatch.setattr("api.mcp_server._get_cache", lambda: cache)
+        result = get_confluence_signals(min_score=0, sources="ARK, darkpool", days=30)
+        assert [s["ticker"] for s in result["signals"]] == ["A", "B"]
+        assert result["metadata"]["filtered"] == 2
+
 
 class TestMarketRegime:
     def test_returns_regime(self):
@@ -645,6 +836,42 @@ class TestMarketRegime:
             # Should not raise, should return a dict
             assert isinstance(result, dict)
 
+    def test_concurrent_cache_misses_fetch_once(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+        from api.routers import macro
+        from api.mcp_server import get_market_regime
+        fetches = []
+
+        def slow_compute():
+            fetches.append(1)
+            time.sleep(0.05)
+            result = {"regime": "green", "components": {}}
+            macro._set_cache(macro._REGIME_CACHE_KEY, result)
+            return result
+
+        monkeypatch.setattr(macro, "_cache", {})
+        monkeypatch.setattr(macro, "_compute_regime_data", slow_compute)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: get_market_regime(), range(4)))
+        assert len(fetches) == 1
+        assert all(r["regime"] == "green" for r in results)
+
+
+class TestCutoffDate:
+    def test_matches_utc_date_arithmetic(self):
+        from api.mcp_server import _cutoff_date
+        for days in (0, 1, 7, 30, 365):
+            expected = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+            assert _cutoff_date(days) == expected
+
+    def test_rolls_over_at_utc_midnight(self, monkeypatch):
+        from api.mcp_server import _cutoff_date
+        midnight = datetime(2026, 3, 1, tzinfo=timezone.utc).timestamp()
+        monkeypatch.setattr("api.mcp_server.time.time", lambda: midnight - 1)
+        assert _cutoff_date(1) == "2026-02-27"
+        monkeypatch.setattr("api.mcp_server.time.time", lambda: midnight)
+        assert _cutoff_date(1) == "2026-02-28"
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 3. Error Handling
@@ -655,6 +882,7 @@ class TestErrorHandling:
     def test_empty_congress_data(self, monkeypatch):
         mock_cache = MagicMock()
         mock_cache.read = MagicMock(return_value={})
+        mock_cache.read_cached = mock_cache.read
         monkeypatch.setattr("api.mcp_server._get_cache", lambda: mock_cache)
 
         from api.mcp_server import get_congress_trades
@@ -665,6 +893,7 @@ class TestErrorHandling:
     def test_empty_ark_data(self, monkeypatch):
         mock_cache = MagicMock()
         mock_cache.read = MagicMock(return_value={})
+        mock_cache.read_cached = mock_cache.read
         monkeypatch.setattr("api.mcp_server._get_cache", lambda: mock_cache)
 
         from api.mcp_server import get_ark_trades
@@ -674,6 +903,7 @@ class TestErrorHandling:
     def test_empty_darkpool_data(self, monkeypatch):
         mock_cache = MagicMock()
         mock_cache.read = MagicMock(return_value={})
+        mock_cache.read_cached = mock_cache.read
         monkeypatch.setattr("api.mcp_server._get_cache", lambda: mock_cache)
 
         from api.mcp_server import get_darkpool_activity
@@ -683,6 +913,7 @@ class TestErrorHandling:
     def test_empty_confluence_data(self, monkeypatch):
         mock_cache = MagicMock()
         mock_cache.read = MagicMock(return_value={})
+        mock_cache.read_cached = mock_cache.read
         monkeypatch.setattr("api.mcp_server._get_cache", lambda: mock_cache)
 
         from api.mcp_server import get_confluence_signals
@@ -692,6 +923,7 @@ class TestErrorHandling:
     def test_missing_trades_key(self, monkeypatch):
         mock_cache = MagicMock()
         mock_cache.read = MagicMock(return_value={"something_else": []})
+        mock_cache.read_cached = mock_cache.read
         monkeypatch.setattr("api.mcp_server._get_cache", lambda: mock_cache)
 
         from api.mcp_server import get_insider_trades
@@ -6,17 +6,22 @@ Validates:
 - Party normalization (D/R/I → full names)
 - Chamber normalization
 - Trade type normalization (all real patterns)
+- Date string → day ordinal
 - ARK change type mapping
 - 13F quarter derivation from filing date
 - CUSIP → Ticker mapping
 """
 
+from datetime import date
+
 import pytest
 from api.utils import (
     parse_amount_range,
     normalize_party,
     normalize_chamber,
     normalize_trade_type,
+    trade_side,
+    date_ordinal,
     ark_change_to_trade_type,
     filing_date_to_quarter,
     cusip_to_ticker,
@@ -131,6 +136,42 @@ class TestNormalizeTradeType:
         assert normalize_trade_type("SALE") == "Sell"
 
 
+class TestTradeSide:
+    def test_buy_variants(self):
+        assert trade_side("Purchase") == "buy"
+        assert trade_side("Buy") == "buy"
+
+    def test_sell_variants(self):
+        assert trade_side("Sale (Partial)") == "sell"
+        assert trade_side("Sale") == "sell"
+        assert trade_side("SELL") == "sell"
+
+    def test_no_side(self):
+        assert trade_side("Exchange") is None
+        assert trade_side("") is None
+        assert trade_side(None) is None
+
+
+# ── Date Ordinals ─────────────────────────────────────────────────────
+
+
+class TestDateOrdinal:
+    def test_plain_date(self):
+        assert date_ordinal("2025-11-14") == date(2025, 11, 14).toordinal()
+
+    def test_timestamp_suffix_ignored(self):
+        assert date_ordinal("2025-11-14T09:30:00") == date_ordinal("2025-11-14")
+
+    def test_unpadded_month(self):
+        assert date_ordinal("2025-1-05") == date(2025, 1, 5).toordinal()
+
+    def test_unparseable(self):
+        assert date_ordinal("2025-02-30") == -1
+        assert date_ordinal("bad") == -1
+        assert date_ordinal("") == -1
+        assert date_ordinal(None) == -1
+
+
 # ── ARK Change Type Mapping ───────────────────────────────────────────
 
 